@@ -0,0 +1,65 @@
+# bench_formatos.py
+# Compara gravar/ler atividades.json (indent=4) com o formato binário .pimb.
+# Uso: python bench_formatos.py [quantidade de notas ...]   (padrão: 10000 100000 1000000)
+import os
+import random
+import sys
+import tempfile
+import time
+
+from escola import armazenamento
+
+ALUNOS_POR_TURMA = 40
+ATIVIDADES_POR_TURMA = 5
+
+def gerar_atividades(total_notas):
+    random.seed(total_notas)
+    atividades = []
+    for i in range(1, total_notas // ALUNOS_POR_TURMA + 1):
+        tid = (i - 1) // ATIVIDADES_POR_TURMA + 1
+        primeiro = (tid - 1) * ALUNOS_POR_TURMA + 1
+        atividades.append({
+            "id": i,
+            "nome": f"Prova {i}",
+            "descricao": "Avaliação bimestral sobre o conteúdo do período.",
+            "turma_id": tid,
+            "notas": {str(primeiro + j): round(random.uniform(0, 10), 1) for j in range(ALUNOS_POR_TURMA)},
+            "_versao": random.randint(1, 5),
+        })
+    return atividades
+
+def medir(funcao, repeticoes):
+    melhor = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        gasto = time.perf_counter() - inicio
+        melhor = gasto if melhor is None else min(melhor, gasto)
+    return melhor, resultado
+
+def main():
+    tamanhos = [int(x) for x in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    print(f"{'notas':>9} | {'formato':7} | {'gravar (s)':>10} | {'ler (s)':>8} | {'tamanho (MB)':>12}")
+    print("-" * 60)
+    with tempfile.TemporaryDirectory() as pasta:
+        for total in tamanhos:
+            dados = gerar_atividades(total)
+            repeticoes = 3 if total <= 100_000 else 1
+            tempos = {}
+            lidos = {}
+            for ext in (".json", armazenamento.EXT_BIN):
+                caminho = os.path.join(pasta, "atividades" + ext)
+                t_gravar, _ = medir(lambda: armazenamento._gravar_disco(caminho, dados), repeticoes)
+                t_ler, lidos[ext] = medir(lambda: armazenamento._ler_disco(caminho), repeticoes)
+                tempos[ext] = (t_gravar, t_ler)
+                mb = os.path.getsize(caminho) / 1e6
+                print(f"{total:>9} | {ext[1:]:7} | {t_gravar:>10.3f} | {t_ler:>8.3f} | {mb:>12.1f}")
+            if not (lidos[".json"] == lidos[armazenamento.EXT_BIN] == dados):
+                print("❌ conversão com perdas!")
+                return 1
+            (gj, lj), (gb, lb) = tempos[".json"], tempos[armazenamento.EXT_BIN]
+            print(f"{'':>9} | ganho   | {gj / gb:>9.1f}x | {lj / lb:>7.1f}x |")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
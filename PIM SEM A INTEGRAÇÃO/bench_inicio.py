@@ -0,0 +1,81 @@
+# bench_inicio.py
+# Mede o tempo até o primeiro menu ("Escolha:") de python pim.py, descontado o
+# tempo de um Python vazio, e lista os imports mais caros com python -X importtime.
+# Falha (código 1) se o ReportLab for importado antes de um PDF ser pedido ou se
+# o início passar do limite.
+# Uso: python bench_inicio.py [limite em ms]   (padrão: 100)
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PIM = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pim.py")
+PROMPT = b"Escolha: "
+PESADOS = ("reportlab",)
+REPETICOES = 7
+
+def ate_primeiro_prompt(pasta, *opcoes):
+    # abre o programa numa pasta vazia, espera o primeiro menu e sai com "0"
+    with tempfile.TemporaryFile() as erros:
+        inicio = time.perf_counter()
+        proc = subprocess.Popen([sys.executable, *opcoes, PIM], cwd=pasta,
+                                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=erros)
+        lido = b""
+        while PROMPT not in lido:
+            parte = os.read(proc.stdout.fileno(), 4096)
+            if not parte:
+                raise RuntimeError("pim.py terminou antes de mostrar o menu")
+            lido += parte
+        gasto = time.perf_counter() - inicio
+        proc.communicate(b"0\n")
+        erros.seek(0)
+        return gasto, erros.read().decode("utf-8", "replace")
+
+def python_vazio():
+    inicio = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return time.perf_counter() - inicio
+
+def ler_importtime(texto):
+    # linhas "import time: self [us] | cumulative | imported package"; recuo = nível
+    modulos = []
+    for l in texto.splitlines():
+        if not l.startswith("import time:") or "imported package" in l:
+            continue
+        _, acumulado, nome = l[len("import time:"):].split("|")
+        nivel = (len(nome) - len(nome.lstrip()) - 1) // 2
+        modulos.append((nome.strip(), int(acumulado), nivel))
+    return modulos
+
+def main():
+    limite_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 100.0
+    with tempfile.TemporaryDirectory() as pasta:
+        ate_primeiro_prompt(pasta)   # aquecimento: cache de bytecode e de disco
+        base = statistics.median(python_vazio() for _ in range(REPETICOES))
+        inicio = statistics.median(ate_primeiro_prompt(pasta)[0] for _ in range(REPETICOES))
+        _, saida = ate_primeiro_prompt(pasta, "-X", "importtime")
+    modulos = ler_importtime(saida)
+    topo = sorted((m for m in modulos if m[2] <= 1), key=lambda m: -m[1])
+    print(f"Python vazio:              {base * 1000:7.1f} ms")
+    print(f"pim.py até o primeiro menu: {inicio * 1000:6.1f} ms  (+{(inicio - base) * 1000:.1f} ms, limite +{limite_ms:.0f} ms)")
+    print(f"imports ({len(modulos)} módulos), os mais caros:")
+    for nome, acumulado, _ in topo[:8]:
+        print(f"  {acumulado / 1000:7.1f} ms  {nome}")
+    if os.environ.get("PYTHONDONTWRITEBYTECODE"):
+        print("⚠️ PYTHONDONTWRITEBYTECODE está ligado: sem __pycache__ os tempos incluem a compilação.")
+    falhas = []
+    pesados = sorted({n for n, _, _ in modulos if n.split(".")[0] in PESADOS})
+    if pesados:
+        falhas.append(f"importados antes de pedir um PDF: {', '.join(pesados[:5])}")
+    if (inicio - base) * 1000 > limite_ms:
+        falhas.append(f"início {(inicio - base) * 1000:.1f} ms acima do Python vazio (limite {limite_ms:.0f} ms)")
+    for f in falhas:
+        print(f"❌ {f}")
+    if not falhas:
+        print("✅ início dentro do limite e sem dependências pesadas.")
+    return 1 if falhas else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
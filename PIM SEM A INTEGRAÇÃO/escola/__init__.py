@@ -0,0 +1,9 @@
+# escola/ - sistema escolar do PIM, separado por assunto:
+#   utilitarios    entrada de dados e listagem paginada
+#   armazenamento  arquivos, trava entre terminais, mescla, .pimb, períodos letivos e buscas
+#   dominio        rankings e cadastros (professores, alunos, turmas, atividades e notas)
+#   arquivo        snapshots compactados
+#   relatorios     relatórios e PDFs (o ReportLab só é importado quando um PDF é pedido)
+#   menus          menus e login
+#   comandos       linha de comando
+# Este arquivo não importa nada: quem usa o pacote importa só o módulo de que precisa.
@@ -0,0 +1,700 @@
+# escola/armazenamento.py - arquivos, trava entre terminais, mescla, formato .pimb, períodos letivos e buscas por id
+import json
+import marshal
+import os
+import struct
+import time
+import zlib
+from contextlib import contextmanager
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from .utilitarios import confirma, input_int, paginar
+
+# =========== ARQUIVOS JSON ===========
+# PIM_FORMATO=binario usa arquivos .pimb (ver "FORMATO BINÁRIO"); o padrão é JSON
+FORMATO = os.environ.get("PIM_FORMATO", "json")
+EXT_BIN = ".pimb"
+EXT = EXT_BIN if FORMATO == "binario" else ".json"
+
+ARQ_PROF = "professores" + EXT
+ARQ_ALUN = "alunos" + EXT
+ARQ_TURM = "turmas" + EXT
+ARQ_ATIV = "atividades" + EXT
+
+# armazenamento por período letivo (ativado por "Organizar dados por período"):
+#   dados/manifesto.json, dados/professores.json, dados/alunos.json
+#   dados/<período>/turmas.json e dados/<período>/turma_<id>.json (atividades e notas)
+PASTA_DADOS = "dados"
+ARQ_MANIFESTO = os.path.join(PASTA_DADOS, "manifesto.json")
+
+# notas em colunas para relatórios somente leitura (ver "NOTAS EM COLUNAS" em relatorios.py)
+ARQ_COLUNAR = "notas.col"
+
+# arquivo de snapshots imutáveis: arquivo/snapshots/<rótulo>.json + arquivo/objetos/
+PASTA_ARQUIVO = "arquivo"
+
+# =========== DADOS EM MEMÓRIA ===========
+professores = []
+alunos = []
+turmas = []
+atividades = []
+_periodo = None                # período atual; None = arquivos únicos (modo antigo)
+_particoes_abertas = set()     # turmas do período atual cujas atividades já foram lidas
+
+# =========== ARMAZENAMENTO CONCORRENTE (TRAVA + VERSÕES) ===========
+# Vários terminais podem usar os mesmos arquivos. Cada gravação:
+#   1. pega a trava exclusiva (arquivo .pim.lock);
+#   2. relê o arquivo do disco;
+#   3. mescla registro a registro (e campo a campo) as alterações locais com
+#      as gravadas por outros terminais, usando o "_versao" de cada registro;
+#   4. grava de forma atômica (arquivo temporário + os.replace).
+# Se o arquivo não mudou desde a última leitura/gravação desta sessão
+# (mtime, tamanho e CRC32), o passo 2 usa a base em memória em vez de reler.
+# Ids de registros novos são reservados sob a trava (ver prox_id), então dois
+# terminais não criam o mesmo id; a renumeração só sobra para quem grava os
+# arquivos sem reservar (scripts de importação, versões antigas).
+ARQ_TRAVA = ".pim.lock"
+ARQ_IDS = ".pim.ids"    # último id reservado por coleção (modo de arquivos únicos)
+CAMPO_VERSAO = "_versao"
+
+_base = {}          # nome do arquivo -> {id: registro como estava no disco}
+_assinaturas = {}   # nome do arquivo -> (mtime_ns, tamanho, crc32, quando foi anotada) do que esta sessão leu/gravou
+# mtime mais grosseiro entre os sistemas de arquivos suportados (FAT grava de 2 em 2 s)
+RESOLUCAO_MTIME_NS = 2_000_000_000
+_trava = None
+_trava_nivel = 0
+_AUSENTE = object()
+
+@contextmanager
+def trava_arquivos():
+    global _trava, _trava_nivel
+    if _trava_nivel == 0:
+        _trava = open(ARQ_TRAVA, "a+")
+        if fcntl:
+            fcntl.flock(_trava.fileno(), fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    _trava.seek(0)
+                    msvcrt.locking(_trava.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+    _trava_nivel += 1
+    try:
+        yield
+    finally:
+        _trava_nivel -= 1
+        if _trava_nivel == 0:
+            if fcntl:
+                fcntl.flock(_trava.fileno(), fcntl.LOCK_UN)
+            else:
+                _trava.seek(0)
+                msvcrt.locking(_trava.fileno(), msvcrt.LK_UNLCK, 1)
+            _trava.close()
+            _trava = None
+
+def _ler_disco(nome):
+    if not os.path.exists(nome):
+        return None
+    with open(nome, "rb") as f:
+        st = os.fstat(f.fileno())
+        bruto = f.read()
+    _assinaturas[nome] = (st.st_mtime_ns, st.st_size, zlib.crc32(bruto), time.time_ns())
+    if nome.endswith(EXT_BIN):
+        try:
+            return decodificar_binario(bruto)
+        except ValueError as e:
+            print(f"⚠️ {nome}: {e}")
+            return None
+    try:
+        return json.loads(bruto.decode("utf-8"))
+    except Exception:
+        return None
+
+def _gravar_disco(nome, dados):
+    if os.path.dirname(nome):
+        os.makedirs(os.path.dirname(nome), exist_ok=True)
+    tmp = nome + ".tmp"
+    if nome.endswith(EXT_BIN):
+        bruto = codificar_binario(dados)
+    else:
+        bruto = json.dumps(dados, ensure_ascii=False, indent=4).encode("utf-8")
+    with open(tmp, "wb") as f:
+        f.write(bruto)
+    os.replace(tmp, nome)
+    st = os.stat(nome)
+    _assinaturas[nome] = (st.st_mtime_ns, st.st_size, zlib.crc32(bruto), time.time_ns())
+
+def _arquivo_alterado(nome):
+    # mtime e tamanho primeiro; o conteúdo é conferido quando eles mudaram
+    # (um "touch" ou uma cópia idêntica não provocam releitura) e também quando a
+    # assinatura foi anotada dentro da resolução do mtime: uma regravação do mesmo
+    # tamanho no mesmo "tique" do relógio do arquivo deixaria mtime e tamanho iguais
+    conhecida = _assinaturas.get(nome)
+    try:
+        st = os.stat(nome)
+    except FileNotFoundError:
+        return conhecida is not None
+    if conhecida is None:
+        return True
+    if (st.st_mtime_ns, st.st_size) == conhecida[:2] and conhecida[3] - st.st_mtime_ns >= RESOLUCAO_MTIME_NS:
+        return False
+    if st.st_size != conhecida[1]:
+        return True
+    with open(nome, "rb") as f:
+        crc = zlib.crc32(f.read())
+    if crc != conhecida[2]:
+        return True
+    _assinaturas[nome] = (st.st_mtime_ns, st.st_size, crc, time.time_ns())
+    return False
+
+def _recarregar(nome, dados):
+    # releitura incremental: corrige em "dados" só os registros que mudaram no disco;
+    # registros com alteração local ainda não gravada ficam para a mescla do próximo salvar
+    with trava_arquivos():
+        if not _arquivo_alterado(nome):
+            return False
+        disco = _ler_disco(nome)
+    if not isinstance(disco, list):
+        return False
+    base = _base.setdefault(nome, {})
+    remotos = {r["id"]: r for r in disco if isinstance(r, dict) and "id" in r}
+    resultado = []
+    mudou = pendente = False
+    for reg in dados:
+        b, r = base.get(reg["id"]), remotos.pop(reg["id"], None)
+        if b is None or reg != b:
+            pendente = True
+            resultado.append(reg)
+        elif r is None:
+            del base[reg["id"]]
+            mudou = True
+        else:
+            if r != b:
+                reg.clear()
+                reg.update(r)
+                base[reg["id"]] = marshal.loads(marshal.dumps(r))
+                mudou = True
+            resultado.append(reg)
+    for rid, r in remotos.items():
+        if rid in base:
+            pendente = True
+        else:
+            resultado.append(r)
+            base[rid] = marshal.loads(marshal.dumps(r))
+            mudou = True
+    if pendente:
+        # a base não corresponde mais ao disco: o próximo salvar precisa reler o arquivo
+        _assinaturas.pop(nome, None)
+    if mudou:
+        resultado.sort(key=lambda x: x["id"])
+        dados[:] = resultado
+    return mudou
+
+def _registrar_base(nome, dados):
+    # cópia independente do que está no disco (base da mescla de 3 vias);
+    # marshal copia os tipos do JSON bem mais rápido que json.loads(json.dumps())
+    _base[nome] = {r["id"]: r for r in marshal.loads(marshal.dumps(dados)) if isinstance(r, dict) and "id" in r}
+
+def _mesclar_valor(base, local, remoto, caminho, conflitos):
+    if local == base:
+        return remoto
+    if remoto == base or local == remoto:
+        return local
+    if isinstance(local, dict) and isinstance(remoto, dict) and (base is _AUSENTE or isinstance(base, dict)):
+        base = {} if base is _AUSENTE else base
+        res = {}
+        for k in list(remoto) + [k for k in local if k not in remoto]:
+            if k == CAMPO_VERSAO:
+                continue
+            v = _mesclar_valor(base.get(k, _AUSENTE), local.get(k, _AUSENTE), remoto.get(k, _AUSENTE),
+                               f"{caminho}.{k}", conflitos)
+            if v is not _AUSENTE:
+                res[k] = v
+        return res
+    if isinstance(local, list) and isinstance(remoto, list) and (base is _AUSENTE or isinstance(base, list)):
+        base = [] if base is _AUSENTE else base
+        try:
+            s_base, s_local, s_remoto = set(base), set(local), set(remoto)
+        except TypeError:
+            pass
+        else:
+            removidos = (s_base - s_local) | (s_base - s_remoto)
+            return [x for x in remoto if x not in removidos] + \
+                   [x for x in local if x not in s_remoto and x not in s_base]
+    conflitos.append(caminho)
+    return remoto
+
+def _base_atividade(atv):
+    arq = _arquivo_particao(atv["turma_id"]) if _periodo else ARQ_ATIV
+    return _base.get(arq, {}).get(atv["id"])
+
+def _renumerar(nome, antigo, novo, dados):
+    # corrige as referências a um registro novo cujo id já tinha sido gravado por outro
+    # terminal. Só muda o que esta sessão criou (ausente da base): as referências do
+    # outro terminal continuam apontando para o registro dele.
+    if nome == ARQ_ALUN:
+        for t in turmas:
+            b = _base.get(ARQ_TURM, {}).get(t["id"])
+            if antigo in t["alunos"] and not (b and antigo in b["alunos"]):
+                t["alunos"] = [novo if x == antigo else x for x in t["alunos"]]
+        for atv in atividades:
+            b = _base_atividade(atv)
+            if str(antigo) in atv.get("notas", {}) and not (b and str(antigo) in b.get("notas", {})):
+                atv["notas"][str(novo)] = atv["notas"].pop(str(antigo))
+    elif nome == ARQ_TURM:
+        for atv in atividades:
+            b = _base_atividade(atv)
+            if atv["turma_id"] == antigo and not (b and b["turma_id"] == antigo):
+                atv["turma_id"] = novo
+    elif nome != ARQ_PROF:
+        # atividades: a lista da turma já foi mesclada com a do outro terminal,
+        # então a referência é decidida pela turma de cada uma das duas atividades
+        nossa = next(a for a in dados if a["id"] == novo)
+        outra = _base.get(nome, {}).get(antigo)
+        t = next((x for x in turmas if x["id"] == nossa["turma_id"]), None)
+        if t and antigo in t.get("atividades", []):
+            if outra and outra["turma_id"] == t["id"]:
+                t["atividades"].append(novo)
+            else:
+                t["atividades"] = [novo if x == antigo else x for x in t["atividades"]]
+
+def _referencias(nome):
+    if nome == ARQ_PROF:
+        return ()
+    return {ARQ_ALUN: (ARQ_TURM, ARQ_ATIV), ARQ_TURM: (ARQ_ATIV,)}.get(nome, (ARQ_TURM,))
+
+def _mesclar(nome, locais, disco):
+    base = _base.get(nome, {})
+    remotos = {r["id"]: r for r in disco}
+    maior = max(list(remotos) + [r["id"] for r in locais], default=0)
+    resultado, conflitos, renumerados = [], [], []
+    alterou_local = recebeu_remoto = False
+    vistos = set()
+    for reg in locais:
+        rid = reg["id"]
+        b, r = base.get(rid), remotos.get(rid)
+        if b is None:
+            alterou_local = True
+            if r is not None and rid not in vistos:
+                # id gravado por quem não reservou: o registro local ganha um id novo
+                novo = _reservar_id(_chave_ids(nome), maior)
+                renumerados.append((rid, novo))
+                reg["id"] = rid = maior = novo
+            reg[CAMPO_VERSAO] = 1
+        elif r is None:
+            recebeu_remoto = True
+            if reg != b:
+                conflitos.append(f"#{rid} (removido por outro terminal)")
+            continue
+        elif r == b:
+            # o disco não mudou desde a base (compara o conteúdo, não só a versão:
+            # scripts de importação gravam sem incrementar _versao)
+            if reg != b:
+                alterou_local = True
+                reg[CAMPO_VERSAO] = b.get(CAMPO_VERSAO, 0) + 1
+        elif reg == b:
+            recebeu_remoto = True
+            reg.clear()
+            reg.update(r)
+        else:
+            alterou_local = recebeu_remoto = True
+            novo = _mesclar_valor(b, reg, r, f"#{rid}", conflitos)
+            reg.clear()
+            reg.update(novo)
+            reg[CAMPO_VERSAO] = r.get(CAMPO_VERSAO, 0) + 1
+        vistos.add(rid)
+        resultado.append(reg)
+    for rid, b in base.items():
+        if rid not in vistos and rid in remotos:
+            if remotos[rid] != b:
+                # removido aqui, alterado no outro terminal: a alteração não se perde
+                recebeu_remoto = True
+                resultado.append(remotos[rid])
+                vistos.add(rid)
+                conflitos.append(f"#{rid} (alterado por outro terminal, removido aqui)")
+            else:
+                alterou_local = True
+    for rid, r in remotos.items():
+        if rid not in base and rid not in vistos:
+            recebeu_remoto = True
+            resultado.append(r)
+    resultado.sort(key=lambda x: x["id"])
+    return resultado, conflitos, renumerados, alterou_local, recebeu_remoto
+
+# =========== FORMATO BINÁRIO (.pimb) ===========
+# Cabeçalho fixo (struct) + conteúdo em marshal, com tamanho e CRC32.
+# Guarda exatamente os tipos do JSON (dict, list, str, int, float, bool, None),
+# então a conversão JSON <-> .pimb não perde nada. O marshal não deve ser usado
+# para arquivos de terceiros: o CRC é conferido antes de decodificar.
+MAGIC_BIN = b"PIMB"
+VERSAO_BIN = 1
+VERSAO_MARSHAL = 4
+_CAB_BIN = struct.Struct("<4sBBQI")  # magic, versão do formato, versão do marshal, tamanho, crc32
+
+def codificar_binario(dados):
+    conteudo = marshal.dumps(dados, VERSAO_MARSHAL)
+    return _CAB_BIN.pack(MAGIC_BIN, VERSAO_BIN, VERSAO_MARSHAL, len(conteudo), zlib.crc32(conteudo)) + conteudo
+
+def decodificar_binario(bruto):
+    if len(bruto) < _CAB_BIN.size:
+        raise ValueError("arquivo .pimb truncado")
+    magic, versao, versao_marshal, tamanho, crc = _CAB_BIN.unpack_from(bruto)
+    if magic != MAGIC_BIN:
+        raise ValueError("não é um arquivo .pimb")
+    if versao > VERSAO_BIN or versao_marshal > marshal.version:
+        raise ValueError(f"arquivo .pimb v{versao} (marshal {versao_marshal}) é mais novo que este programa")
+    conteudo = memoryview(bruto)[_CAB_BIN.size:]
+    if len(conteudo) != tamanho:
+        raise ValueError("arquivo .pimb com tamanho errado (truncado ou corrompido)")
+    if zlib.crc32(conteudo) != crc:
+        raise ValueError("arquivo .pimb corrompido (CRC32 não confere)")
+    try:
+        return marshal.loads(conteudo)
+    except (EOFError, TypeError, ValueError):
+        raise ValueError("arquivo .pimb com conteúdo inválido")
+
+def converter_arquivo(origem, destino):
+    # a extensão de cada lado (.json ou .pimb) define o formato
+    if not os.path.exists(origem):
+        raise FileNotFoundError(f"{origem} não existe.")
+    dados = _ler_disco(origem)
+    if dados is None:
+        raise ValueError(f"{origem} não pôde ser lido.")
+    _gravar_disco(destino, dados)
+    if _ler_disco(destino) != dados:
+        raise ValueError(f"conversão de {origem} não confere.")
+
+def converter_dados(formato):
+    # converte todos os arquivos de dados (modo antigo e pasta dados/), mantendo os originais
+    de, para = (".json", EXT_BIN) if formato == "binario" else (EXT_BIN, ".json")
+    origens = [n + de for n in ("professores", "alunos", "turmas", "atividades") if os.path.exists(n + de)]
+    for raiz, _, nomes in os.walk(PASTA_DADOS):
+        origens += [os.path.join(raiz, n) for n in nomes
+                    if n.endswith(de) and os.path.join(raiz, n) != ARQ_MANIFESTO]
+    with trava_arquivos():
+        for origem in origens:
+            converter_arquivo(origem, origem[:-len(de)] + para)
+    return origens
+
+# =========== UTILITÁRIOS ===========
+def carregar_arquivo(nome, default=[]):
+    with trava_arquivos():
+        dados = _ler_disco(nome)
+    if not isinstance(dados, list):
+        _base[nome] = {}
+        return default
+    _registrar_base(nome, dados)
+    return dados
+
+def salvar_arquivo(nome, dados):
+    with trava_arquivos():
+        if _conferir_organizacao("A alteração NÃO foi gravada; dados recarregados, refaça a operação."):
+            return
+        if _periodo and nome == ARQ_ATIV:
+            _salvar_particoes()
+            return
+        if nome in _base and not _arquivo_alterado(nome):
+            disco = list(_base[nome].values())
+        else:
+            disco = _ler_disco(nome)
+        if not isinstance(disco, list):
+            disco = []
+        mesclados, conflitos, renumerados, alterou_local, recebeu_remoto = _mesclar(nome, dados, disco)
+        if alterou_local or not os.path.exists(nome):
+            _gravar_disco(nome, mesclados)
+        _registrar_base(nome, mesclados)
+        dados[:] = mesclados
+        invalidar_indices()
+        if recebeu_remoto or renumerados:
+            _dados_alterados()
+        for antigo, novo in renumerados:
+            _renumerar(nome, antigo, novo, dados)
+            print(f"⚠️ {nome}: id {antigo} já usado por outro terminal; registro gravado com id {novo}.")
+        for c in conflitos:
+            print(f"⚠️ Conflito em {nome} {c}: mantida a versão gravada por outro terminal.")
+        if renumerados:
+            for ref in _referencias(nome):
+                salvar_arquivo(ref, _colecao(ref))
+
+def _colecao(nome):
+    return {ARQ_PROF: professores, ARQ_ALUN: alunos, ARQ_TURM: turmas, ARQ_ATIV: atividades}[nome]
+
+def salvar_tudo():
+    with trava_arquivos():
+        salvar_arquivo(ARQ_PROF, professores)
+        salvar_arquivo(ARQ_ALUN, alunos)
+        salvar_arquivo(ARQ_TURM, turmas)
+        salvar_arquivo(ARQ_ATIV, atividades)
+
+def localizar_dados():
+    # define onde estão os arquivos (modo antigo ou pasta dados/) sem carregar nada
+    global ARQ_PROF, ARQ_ALUN, ARQ_TURM, _periodo
+    manifesto = _ler_disco(ARQ_MANIFESTO)
+    if isinstance(manifesto, dict):
+        _periodo = manifesto["periodo_atual"]
+        ARQ_PROF = os.path.join(PASTA_DADOS, "professores" + EXT)
+        ARQ_ALUN = os.path.join(PASTA_DADOS, "alunos" + EXT)
+        ARQ_TURM = os.path.join(PASTA_DADOS, _periodo, "turmas" + EXT)
+
+def carregar_tudo():
+    # as listas são preenchidas no lugar: os outros módulos guardam referência a elas
+    localizar_dados()
+    professores[:] = carregar_arquivo(ARQ_PROF, [])
+    alunos[:] = carregar_arquivo(ARQ_ALUN, [])
+    turmas[:] = carregar_arquivo(ARQ_TURM, [])
+    # no modo por período as atividades só são lidas quando a turma é aberta
+    _particoes_abertas.clear()
+    atividades[:] = [] if _periodo else carregar_arquivo(ARQ_ATIV, [])
+    _dados_alterados()
+    # garante que arquivos existam (cria se faltarem)
+    salvar_tudo()
+
+def recarregar_alteracoes():
+    # chamada entre um menu e outro: relê só os arquivos alterados por outro terminal ou script
+    with trava_arquivos():
+        if _conferir_organizacao("Dados recarregados."):
+            return [ARQ_MANIFESTO]
+    arquivos = [(ARQ_PROF, professores), (ARQ_ALUN, alunos), (ARQ_TURM, turmas)]
+    if not _periodo:
+        arquivos.append((ARQ_ATIV, atividades))
+    alterados = [nome for nome, dados in arquivos if _recarregar(nome, dados)]
+    for tid in sorted(_particoes_abertas):
+        grupo = [a for a in atividades if a["turma_id"] == tid]
+        if _recarregar(_arquivo_particao(tid), grupo):
+            atividades[:] = sorted([a for a in atividades if a["turma_id"] != tid] + grupo, key=lambda a: a["id"])
+            alterados.append(_arquivo_particao(tid))
+    if alterados:
+        invalidar_indices()
+        _dados_alterados()
+        print(f"🔄 Atualizado com alterações feitas fora desta sessão: {', '.join(alterados)}")
+    return alterados
+
+def _chave_ids(nome):
+    return {ARQ_PROF: "professores", ARQ_ALUN: "alunos", ARQ_TURM: "turmas"}.get(nome, "atividades")
+
+def _reservar_id(chave, maior):
+    # sob a trava: reserva o próximo id de "chave" (maior que "maior" e que qualquer
+    # id já reservado), no manifesto do modo por período ou em .pim.ids
+    with trava_arquivos():
+        arq = ARQ_MANIFESTO if _periodo else ARQ_IDS
+        externo = arq == ARQ_MANIFESTO and _arquivo_alterado(arq)
+        reservas = _ler_disco(arq)
+        if not isinstance(reservas, dict):
+            reservas = {}
+        ultimo = reservas.setdefault("ultimo_id", {})
+        novo = max(maior, ultimo.get(chave, 0)) + 1
+        ultimo[chave] = novo
+        _gravar_disco(arq, reservas)
+        if externo:
+            # a reserva não pode esconder uma mudança de período feita por outro terminal:
+            # a próxima gravação confere o manifesto de novo
+            _assinaturas.pop(arq, None)
+    return novo
+
+def prox_id(lista):
+    # o id é reservado na hora do cadastro: outro terminal cadastrando ao mesmo
+    # tempo recebe outro id, e nada precisa ser renumerado ao salvar
+    chave = {id(professores): "professores", id(alunos): "alunos",
+             id(turmas): "turmas", id(atividades): "atividades"}[id(lista)]
+    maior = max((x.get("id", 0) for x in lista), default=0)
+    if not _periodo:
+        arq = {"professores": ARQ_PROF, "alunos": ARQ_ALUN, "turmas": ARQ_TURM, "atividades": ARQ_ATIV}[chave]
+        maior = max([maior, *_base.get(arq, {})])
+    return _reservar_id(chave, maior)
+
+# =========== PERÍODOS LETIVOS (PARTIÇÕES) ===========
+def _arquivo_particao(tid, periodo=None):
+    return os.path.join(PASTA_DADOS, periodo or _periodo, f"turma_{tid}{EXT}")
+
+def _organizacao_mudou():
+    # sob a trava: outro terminal encerrou o período atual ou organizou os dados por
+    # período depois que esta sessão os carregou (só relê o manifesto se ele mudou)
+    if not _arquivo_alterado(ARQ_MANIFESTO):
+        return False
+    manifesto = _ler_disco(ARQ_MANIFESTO)
+    if not isinstance(manifesto, dict):
+        return False
+    if manifesto["periodo_atual"] != _periodo:
+        return True
+    return manifesto["periodos"].get(_periodo, {}).get("somente_leitura", False)
+
+def _conferir_organizacao(aviso):
+    # nada é gravado nos arquivos antigos: avisa e recarrega na organização nova
+    if not _organizacao_mudou():
+        return False
+    carregar_tudo()
+    print(f"⚠️ Outro terminal mudou a organização dos períodos (atual: {_periodo}). {aviso}")
+    return True
+
+def abrir_turma(tid):
+    # carrega sob demanda as atividades (e notas) de uma turma do período atual
+    if not _periodo or tid in _particoes_abertas:
+        return
+    _particoes_abertas.add(tid)
+    atividades.extend(carregar_arquivo(_arquivo_particao(tid), []))
+    _dados_alterados()
+
+def abrir_periodo():
+    for t in turmas:
+        abrir_turma(t["id"])
+
+def _particao_alterada(caminho, grupo):
+    base = _base.get(caminho, {})
+    return len(base) != len(grupo) or any(base.get(a["id"]) != a for a in grupo)
+
+def _salvar_particoes():
+    # grava só as partições (turmas) com alterações
+    grupos = {tid: [] for tid in _particoes_abertas}
+    for a in atividades:
+        grupos.setdefault(a["turma_id"], []).append(a)
+    resultado = []
+    with trava_arquivos():
+        for tid, grupo in grupos.items():
+            caminho = _arquivo_particao(tid)
+            if _particao_alterada(caminho, grupo) or not os.path.exists(caminho):
+                _particoes_abertas.add(tid)
+                salvar_arquivo(caminho, grupo)
+            resultado.extend(grupo)
+    resultado.sort(key=lambda a: a["id"])
+    atividades[:] = resultado
+    invalidar_indices()
+
+def organizar_por_periodo():
+    if _periodo:
+        print(f"Os dados já estão organizados por período (atual: {_periodo}).")
+        return
+    periodo = input("Nome do período atual (ex.: 2025-1): ").strip()
+    if not periodo or os.sep in periodo or "/" in periodo:
+        print("Nome de período inválido.")
+        return
+    if not confirma(f"Mover turmas, atividades e notas para '{PASTA_DADOS}/{periodo}'? (s/n): "):
+        return
+    with trava_arquivos():
+        if _conferir_organizacao("Nada foi movido; dados recarregados."):
+            return
+        salvar_tudo()
+        _gravar_disco(os.path.join(PASTA_DADOS, "professores" + EXT), professores)
+        _gravar_disco(os.path.join(PASTA_DADOS, "alunos" + EXT), alunos)
+        _gravar_disco(os.path.join(PASTA_DADOS, periodo, "turmas" + EXT), turmas)
+        grupos = {t["id"]: [] for t in turmas}
+        for a in atividades:
+            grupos.setdefault(a["turma_id"], []).append(a)
+        for tid, grupo in grupos.items():
+            _gravar_disco(_arquivo_particao(tid, periodo), grupo)
+        ultimo = {nome: max((x["id"] for x in lista), default=0) for nome, lista in
+                  (("professores", professores), ("alunos", alunos), ("turmas", turmas), ("atividades", atividades))}
+        _gravar_disco(ARQ_MANIFESTO, {"periodo_atual": periodo,
+                                      "periodos": {periodo: {"somente_leitura": False}},
+                                      "ultimo_id": ultimo})
+    carregar_tudo()
+    print(f"✅ Dados organizados em '{PASTA_DADOS}/'. Os arquivos antigos (*.json nesta pasta) não são mais usados.")
+
+def encerrar_periodo():
+    if not _periodo:
+        print("Organize os dados por período primeiro.")
+        return
+    novo = input(f"Nome do novo período (atual: {_periodo}): ").strip()
+    if not novo or os.sep in novo or "/" in novo:
+        print("Nome de período inválido.")
+        return
+    if novo in _ler_disco(ARQ_MANIFESTO)["periodos"]:
+        print("Esse período já existe.")
+        return
+    # as perguntas vêm antes da trava: os outros terminais não ficam esperando a resposta
+    copiar = confirma("Copiar as turmas e alunos matriculados (sem atividades) para o novo período? (s/n): ")
+    if not confirma(f"Encerrar {_periodo}? Ele ficará somente leitura. (s/n): "):
+        return
+    with trava_arquivos():
+        manifesto = _ler_disco(ARQ_MANIFESTO)
+        if novo in manifesto["periodos"] or manifesto["periodos"][_periodo].get("somente_leitura"):
+            print("Outro terminal alterou os períodos enquanto você respondia. Nada foi feito.")
+            return
+        salvar_tudo()
+        novas_turmas = [{"id": t["id"], "nome": t["nome"], "alunos": list(t["alunos"]), "atividades": []}
+                        for t in turmas] if copiar else []
+        _gravar_disco(os.path.join(PASTA_DADOS, novo, "turmas" + EXT), novas_turmas)
+        manifesto["periodos"][_periodo]["somente_leitura"] = True
+        manifesto["periodos"][novo] = {"somente_leitura": False}
+        manifesto["periodo_atual"] = novo
+        _gravar_disco(ARQ_MANIFESTO, manifesto)
+    carregar_tudo()
+    print(f"✅ Período {novo} iniciado.")
+
+def consultar_periodo_anterior():
+    # leitura avulsa: nada do período consultado entra nas listas em memória
+    manifesto = _ler_disco(ARQ_MANIFESTO) if _periodo else None
+    anteriores = [p for p in (manifesto or {}).get("periodos", {}) if p != _periodo]
+    if not anteriores:
+        print("Nenhum período anterior.")
+        return
+    print("Períodos anteriores: " + ", ".join(anteriores))
+    periodo = input("Período: ").strip()
+    if periodo not in anteriores:
+        print("Período não encontrado.")
+        return
+    turmas_p = _ler_disco(os.path.join(PASTA_DADOS, periodo, "turmas" + EXT)) or []
+    paginar(f"TURMAS DE {periodo}", turmas_p, lambda t: f"{t['id']} - {t['nome']}",
+            vazio="Nenhuma turma neste período.")
+    tid = input_int("ID da turma (0 cancelar): ", min_val=0)
+    if tid == 0: return
+    t = next((x for x in turmas_p if x["id"] == tid), None)
+    if not t:
+        print("Turma não encontrada.")
+        return
+    ativs = _ler_disco(_arquivo_particao(tid, periodo)) or []
+    def formatar(aid):
+        a = buscar_aluno_por_id(aid)
+        notas = [f"{atv['nome']}: {atv['notas'][str(aid)]}" for atv in ativs if str(aid) in atv.get("notas", {})]
+        nome = f"{a['matricula']} - {a['nome']}" if a else f"Aluno {aid}"
+        return f"{nome} -> {' | '.join(notas) if notas else 'Sem notas'}"
+    paginar(f"Relatório da Turma {t['nome']} ({periodo}, somente leitura)", t["alunos"], formatar,
+            chave=lambda aid: aid, vazio="Sem alunos matriculados.")
+
+# =========== BUSCAS ===========
+_indices = {}  # id(lista) -> (lista, tamanho, {id: registro})
+
+def _indice(lista):
+    ent = _indices.get(id(lista))
+    if ent is None or ent[0] is not lista or ent[1] != len(lista):
+        ent = (lista, len(lista), {x["id"]: x for x in lista})
+        _indices[id(lista)] = ent
+    return ent[2]
+
+def invalidar_indices():
+    _indices.clear()
+
+# caches derivados dos dados (ex.: rankings) se registram aqui para serem
+# descartados quando os dados mudam por fora: carga, mescla, partição aberta
+_ao_alterar = []
+
+def ao_alterar_dados(funcao):
+    _ao_alterar.append(funcao)
+    return funcao
+
+def _dados_alterados():
+    for funcao in _ao_alterar:
+        funcao()
+
+def buscar_professor_por_id(pid):
+    return _indice(professores).get(pid)
+
+def buscar_aluno_por_id(aid):
+    return _indice(alunos).get(aid)
+
+def buscar_turma_por_id(tid):
+    return _indice(turmas).get(tid)
+
+def buscar_atividade_por_id(aid):
+    atv = _indice(atividades).get(aid)
+    if atv is None and _periodo:
+        dona = next((t for t in turmas if aid in t.get("atividades", [])), None)
+        if dona and dona["id"] not in _particoes_abertas:
+            abrir_turma(dona["id"])
+            atv = _indice(atividades).get(aid)
+    return atv
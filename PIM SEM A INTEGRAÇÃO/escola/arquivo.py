@@ -0,0 +1,275 @@
+# escola/arquivo.py - snapshots compactados e imutáveis (arquivar, comparar, restaurar)
+import hashlib
+import json
+import os
+import time
+import zlib
+
+from . import armazenamento
+from .utilitarios import confirma, input_int
+from .armazenamento import (
+    CAMPO_VERSAO, PASTA_ARQUIVO, _gravar_disco, _indice, _ler_disco, abrir_periodo, abrir_turma, alunos,
+    atividades, buscar_aluno_por_id, buscar_atividade_por_id, buscar_turma_por_id, invalidar_indices,
+    professores, salvar_tudo, trava_arquivos, turmas,
+)
+from .dominio import definir_nota, invalidar_rankings
+
+# =========== ARQUIVO (SNAPSHOTS COMPACTADOS E IMUTÁVEIS) ===========
+# Cada coleção é dividida em baldes de TAM_BALDE ids consecutivos. Cada balde é
+# gravado compactado (zlib) em arquivo/objetos/, nomeado pelo sha256 do conteúdo,
+# então baldes que não mudaram entre dois snapshots são o mesmo objeto.
+# O snapshot em si só guarda {coleção: {balde: hash}}; comparar dois snapshots
+# só abre os baldes com hash diferente e restaurar um registro só abre o balde dele.
+# O índice aluno -> turmas é guardado em baldes do mesmo jeito: restaurar um aluno
+# abre o balde dele no índice e só os baldes das turmas em que estava matriculado.
+TAM_BALDE = 128
+COLECOES_ARQUIVO = ("professores", "alunos", "turmas", "atividades")
+
+def _canonico(obj):
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+def _caminho_objeto(h):
+    return os.path.join(PASTA_ARQUIVO, "objetos", h[:2], h[2:])
+
+def _gravar_objeto(obj):
+    dados = _canonico(obj)
+    h = hashlib.sha256(dados).hexdigest()
+    caminho = _caminho_objeto(h)
+    if os.path.exists(caminho):
+        return h, False
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    with open(caminho + ".tmp", "wb") as f:
+        f.write(zlib.compress(dados, 9))
+    os.replace(caminho + ".tmp", caminho)
+    os.chmod(caminho, 0o444)
+    return h, True
+
+def _gravar_baldes(baldes):
+    # {balde: registros} -> ({balde: hash}, quantos objetos eram novos)
+    hashes, novos = {}, 0
+    for b, regs in baldes.items():
+        hashes[str(b)], novo = _gravar_objeto(regs)
+        novos += novo
+    return hashes, novos
+
+def _ler_objeto(h):
+    with open(_caminho_objeto(h), "rb") as f:
+        return json.loads(zlib.decompress(f.read()))
+
+def _caminho_snapshot(rotulo):
+    return os.path.join(PASTA_ARQUIVO, "snapshots", f"{rotulo}.json")
+
+def _ler_snapshot(rotulo):
+    snap = _ler_disco(_caminho_snapshot(rotulo))
+    if not isinstance(snap, dict):
+        raise FileNotFoundError(f"Snapshot '{rotulo}' não encontrado.")
+    return snap
+
+def listar_snapshots():
+    pasta = os.path.join(PASTA_ARQUIVO, "snapshots")
+    if not os.path.isdir(pasta):
+        return []
+    return sorted(n[:-5] for n in os.listdir(pasta) if n.endswith(".json"))
+
+def arquivar(rotulo):
+    if not rotulo or os.sep in rotulo or "/" in rotulo:
+        raise ValueError("Rótulo inválido.")
+    if os.path.exists(_caminho_snapshot(rotulo)):
+        raise FileExistsError(f"Já existe um snapshot '{rotulo}' (snapshots são imutáveis).")
+    novos = reaproveitados = registros = 0
+    colecoes = {}
+    with trava_arquivos():
+        salvar_tudo()
+        abrir_periodo()
+        for nome, lista in zip(COLECOES_ARQUIVO, (professores, alunos, turmas, atividades)):
+            baldes = {}
+            for r in lista:
+                conteudo = {k: v for k, v in r.items() if k != CAMPO_VERSAO}
+                baldes.setdefault(r["id"] // TAM_BALDE, {})[str(r["id"])] = conteudo
+                registros += 1
+            hashes, n = _gravar_baldes(baldes)
+            novos += n
+            reaproveitados += len(hashes) - n
+            colecoes[nome] = {"raiz": hashlib.sha256(_canonico(hashes)).hexdigest(), "baldes": hashes}
+        turmas_do_aluno = {}
+        for t in turmas:
+            for aid in t["alunos"]:
+                turmas_do_aluno.setdefault(aid // TAM_BALDE, {}).setdefault(str(aid), []).append(t["id"])
+        hashes, n = _gravar_baldes(turmas_do_aluno)
+        novos += n
+        reaproveitados += len(hashes) - n
+        snap = {"rotulo": rotulo, "criado_em": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "periodo": armazenamento._periodo, "tam_balde": TAM_BALDE, "colecoes": colecoes,
+                "indices": {"turmas_do_aluno": {"baldes": hashes}}}
+        _gravar_disco(_caminho_snapshot(rotulo), snap)
+        os.chmod(_caminho_snapshot(rotulo), 0o444)
+    return {"registros": registros, "baldes_novos": novos, "baldes_reaproveitados": reaproveitados}
+
+def _buscar_no_arquivo(snap, colecao, ids, grupo="colecoes"):
+    baldes = snap.get(grupo, {}).get(colecao, {}).get("baldes", {})
+    tam = snap.get("tam_balde", TAM_BALDE)
+    por_balde = {}
+    for rid in ids:
+        por_balde.setdefault(str(rid // tam), []).append(rid)
+    achados = {}
+    for b, rids in por_balde.items():
+        if b not in baldes:
+            continue
+        regs = _ler_objeto(baldes[b])
+        for rid in rids:
+            if str(rid) in regs:
+                achados[rid] = regs[str(rid)]
+    return achados
+
+def _todos_do_arquivo(snap, colecao):
+    for h in snap["colecoes"].get(colecao, {}).get("baldes", {}).values():
+        yield from _ler_objeto(h).values()
+
+def comparar_snapshots(rotulo_a, rotulo_b):
+    # {coleção: (incluídos, removidos, alterados)}; alterados = [(id, [campos])]
+    sa, sb = _ler_snapshot(rotulo_a), _ler_snapshot(rotulo_b)
+    resultado = {}
+    for nome in COLECOES_ARQUIVO:
+        ca = sa["colecoes"].get(nome, {"raiz": None, "baldes": {}})
+        cb = sb["colecoes"].get(nome, {"raiz": None, "baldes": {}})
+        incluidos, removidos, alterados = [], [], []
+        if ca["raiz"] != cb["raiz"]:
+            for b in sorted(set(ca["baldes"]) | set(cb["baldes"]), key=int):
+                ha, hb = ca["baldes"].get(b), cb["baldes"].get(b)
+                if ha == hb:
+                    continue
+                ra = _ler_objeto(ha) if ha else {}
+                rb = _ler_objeto(hb) if hb else {}
+                for rid in sorted(set(ra) | set(rb), key=int):
+                    if rid not in ra:
+                        incluidos.append(int(rid))
+                    elif rid not in rb:
+                        removidos.append(int(rid))
+                    elif ra[rid] != rb[rid]:
+                        campos = sorted(k for k in set(ra[rid]) | set(rb[rid]) if ra[rid].get(k) != rb[rid].get(k))
+                        alterados.append((int(rid), campos))
+        resultado[nome] = (incluidos, removidos, alterados)
+    return resultado
+
+def _substituir(lista, reg):
+    atual = _indice(lista).get(reg["id"])
+    if atual is None:
+        lista.append(dict(reg))
+        return
+    versao = atual.get(CAMPO_VERSAO)
+    atual.clear()
+    atual.update(reg)
+    if versao is not None:
+        atual[CAMPO_VERSAO] = versao
+
+def restaurar_turma(rotulo, tid):
+    snap = _ler_snapshot(rotulo)
+    t_arq = _buscar_no_arquivo(snap, "turmas", [tid]).get(tid)
+    if not t_arq:
+        raise KeyError(f"Turma #{tid} não existe no snapshot '{rotulo}'.")
+    ativs = _buscar_no_arquivo(snap, "atividades", t_arq.get("atividades", []))
+    with trava_arquivos():
+        salvar_tudo()
+        abrir_turma(tid)
+        faltando = [aid for aid in t_arq["alunos"] if not buscar_aluno_por_id(aid)]
+        for a in _buscar_no_arquivo(snap, "alunos", faltando).values():
+            _substituir(alunos, a)
+        ignoradas = [aid for aid in ativs if (atv := buscar_atividade_por_id(aid)) and atv["turma_id"] != tid]
+        for aid in ignoradas:
+            print(f"⚠️ Atividade #{aid} hoje pertence a outra turma; não foi restaurada.")
+        manter = set(ativs) - set(ignoradas)
+        atividades[:] = [a for a in atividades if a["turma_id"] != tid or a["id"] in manter]
+        invalidar_indices()
+        for aid in manter:
+            _substituir(atividades, ativs[aid])
+        t_arq = dict(t_arq, atividades=[aid for aid in t_arq.get("atividades", []) if aid not in ignoradas])
+        _substituir(turmas, t_arq)
+        invalidar_rankings()
+        salvar_tudo()
+    return {"atividades": len(manter), "alunos_recriados": len(faltando)}
+
+def restaurar_aluno(rotulo, aid):
+    snap = _ler_snapshot(rotulo)
+    a_arq = _buscar_no_arquivo(snap, "alunos", [aid]).get(aid)
+    if not a_arq:
+        raise KeyError(f"Aluno #{aid} não existe no snapshot '{rotulo}'.")
+    if "indices" in snap:
+        tids = _buscar_no_arquivo(snap, "turmas_do_aluno", [aid], grupo="indices").get(aid, [])
+        turmas_arq = list(_buscar_no_arquivo(snap, "turmas", tids).values())
+    else:
+        # snapshot anterior ao índice: percorre todas as turmas
+        turmas_arq = [t for t in _todos_do_arquivo(snap, "turmas") if aid in t.get("alunos", [])]
+    ativs = _buscar_no_arquivo(snap, "atividades", [x for t in turmas_arq for x in t.get("atividades", [])])
+    matriculas = notas = 0
+    with trava_arquivos():
+        salvar_tudo()
+        _substituir(alunos, a_arq)
+        for t_arq in turmas_arq:
+            t = buscar_turma_por_id(t_arq["id"])
+            if not t:
+                continue
+            if aid not in t["alunos"]:
+                t["alunos"].append(aid)
+                matriculas += 1
+            for atv_id in t_arq.get("atividades", []):
+                atv = buscar_atividade_por_id(atv_id)
+                nota = ativs.get(atv_id, {}).get("notas", {}).get(str(aid))
+                if atv and atv["turma_id"] == t["id"] and nota is not None:
+                    definir_nota(atv, aid, nota)
+                    notas += 1
+        invalidar_rankings()
+        salvar_tudo()
+    return {"matriculas": matriculas, "notas": notas}
+
+def imprimir_comparacao(rotulo_a, rotulo_b, resultado):
+    linhas = [f"Diferenças de '{rotulo_a}' para '{rotulo_b}':"]
+    for nome, (incluidos, removidos, alterados) in resultado.items():
+        if not (incluidos or removidos or alterados):
+            continue
+        linhas.append(f"\n{nome}: +{len(incluidos)} -{len(removidos)} ~{len(alterados)}")
+        linhas.extend(f"  + #{rid}" for rid in incluidos)
+        linhas.extend(f"  - #{rid}" for rid in removidos)
+        linhas.extend(f"  ~ #{rid} ({', '.join(campos)})" for rid, campos in alterados)
+    if len(linhas) == 1:
+        linhas.append("Nenhuma diferença.")
+    print("\n".join(linhas))
+
+def arquivo_ui():
+    print("\n1. Arquivar dados atuais (snapshot)")
+    print("2. Comparar dois snapshots")
+    print("3. Restaurar uma turma de um snapshot")
+    print("4. Restaurar um aluno de um snapshot")
+    op = input("Escolha: ").strip()
+    snaps = listar_snapshots()
+    if op != "1":
+        if not snaps:
+            print("Nenhum snapshot arquivado.")
+            return
+        print("Snapshots: " + ", ".join(snaps))
+    try:
+        if op == "1":
+            rotulo = input("Rótulo do snapshot (ex.: 2025-1-final): ").strip()
+            r = arquivar(rotulo)
+            print(f"✅ Snapshot '{rotulo}': {r['registros']} registros, {r['baldes_novos']} baldes novos, "
+                  f"{r['baldes_reaproveitados']} reaproveitados.")
+        elif op == "2":
+            a = input("Snapshot antigo: ").strip()
+            b = input("Snapshot novo: ").strip()
+            imprimir_comparacao(a, b, comparar_snapshots(a, b))
+        elif op == "3":
+            rotulo = input("Snapshot: ").strip()
+            tid = input_int("ID da turma (0 cancelar): ", min_val=0)
+            if tid == 0: return
+            if confirma(f"Substituir a turma #{tid} e suas atividades pela versão de '{rotulo}'? (s/n): "):
+                r = restaurar_turma(rotulo, tid)
+                print(f"✅ Turma restaurada ({r['atividades']} atividades, {r['alunos_recriados']} alunos recriados).")
+        elif op == "4":
+            rotulo = input("Snapshot: ").strip()
+            aid = input_int("ID do aluno (0 cancelar): ", min_val=0)
+            if aid == 0: return
+            r = restaurar_aluno(rotulo, aid)
+            print(f"✅ Aluno restaurado ({r['matriculas']} matrículas, {r['notas']} notas).")
+        else:
+            print("Opção inválida.")
+    except (ValueError, KeyError, OSError) as e:
+        print(f"❌ {e.args[0] if e.args else e}")
@@ -0,0 +1,131 @@
+# escola/comandos.py - comandos de linha de comando (python pim.py <comando>)
+
+from .armazenamento import carregar_tudo, converter_arquivo, converter_dados
+from .dominio import CORTE_APROVACAO, imprimir_problemas, reparar_dados, verificar_integridade
+from .arquivo import (
+    _ler_snapshot, arquivar, comparar_snapshots, imprimir_comparacao, listar_snapshots, restaurar_aluno,
+    restaurar_turma,
+)
+from .relatorios import (
+    consultar_em_risco, exportar_em_risco, exportar_notas_colunar_ui, formatar_em_risco,
+    relatorio_inteligente_colunar,
+)
+
+# =========== COMANDOS (LINHA DE COMANDO) ===========
+# python pim.py verificar [--reparar]
+# python pim.py arquivar <rótulo> | snapshots | comparar <a> <b>
+# python pim.py restaurar-turma <rótulo> <id> | restaurar-aluno <rótulo> <id>
+# python pim.py converter <origem> <destino> | converter-dados <binario|json>
+# python pim.py exportar-colunar | relatorio-colunar [arquivo]
+def cmd_verificar(args):
+    if "--reparar" in args:
+        problemas = reparar_dados()
+        imprimir_problemas(problemas)
+        if problemas:
+            print("✅ Dados reparados e gravados.")
+        return 0
+    carregar_tudo()
+    problemas = verificar_integridade()
+    imprimir_problemas(problemas)
+    return 1 if problemas else 0
+
+def cmd_arquivar(args):
+    carregar_tudo()
+    r = arquivar(args[0])
+    print(f"✅ Snapshot '{args[0]}': {r['registros']} registros, {r['baldes_novos']} baldes novos, "
+          f"{r['baldes_reaproveitados']} reaproveitados.")
+    return 0
+
+def cmd_snapshots(args):
+    for rotulo in listar_snapshots():
+        snap = _ler_snapshot(rotulo)
+        print(f"{rotulo}  ({snap['criado_em']}{', período ' + snap['periodo'] if snap.get('periodo') else ''})")
+    return 0
+
+def cmd_comparar(args):
+    imprimir_comparacao(args[0], args[1], comparar_snapshots(args[0], args[1]))
+    return 0
+
+def cmd_restaurar_turma(args):
+    carregar_tudo()
+    r = restaurar_turma(args[0], int(args[1]))
+    print(f"✅ Turma restaurada ({r['atividades']} atividades, {r['alunos_recriados']} alunos recriados).")
+    return 0
+
+def cmd_restaurar_aluno(args):
+    carregar_tudo()
+    r = restaurar_aluno(args[0], int(args[1]))
+    print(f"✅ Aluno restaurado ({r['matriculas']} matrículas, {r['notas']} notas).")
+    return 0
+
+def cmd_converter(args):
+    converter_arquivo(args[0], args[1])
+    print(f"✅ {args[0]} -> {args[1]}")
+    return 0
+
+def cmd_converter_dados(args):
+    if args[0] not in ("binario", "json"):
+        print("Use: converter-dados binario | converter-dados json")
+        return 2
+    origens = converter_dados(args[0])
+    print(f"✅ {len(origens)} arquivo(s) convertido(s). Os originais foram mantidos.")
+    if args[0] == "binario":
+        print("Para usar os arquivos .pimb, rode com PIM_FORMATO=binario.")
+    return 0
+
+def cmd_exportar_colunar(args):
+    carregar_tudo()
+    exportar_notas_colunar_ui()
+    return 0
+
+def cmd_relatorio_colunar(args):
+    relatorio_inteligente_colunar(args[0] if args else None)
+    return 0
+
+def cmd_em_risco(args):
+    # em-risco [--media N] [--faltantes N] [--turma ID] [--atividade ID] [--nota N] [--csv arquivo]
+    opcoes = dict(zip(args[::2], args[1::2]))
+    desconhecidas = set(opcoes) - {"--media", "--faltantes", "--turma", "--atividade", "--nota", "--csv"}
+    if desconhecidas or len(args) % 2:
+        raise ValueError(f"opções inválidas: {' '.join(args)}")
+    carregar_tudo()
+    numero = lambda k, tipo: tipo(opcoes[k].replace(",", ".")) if k in opcoes else None
+    media = numero("--media", float)
+    if not set(opcoes) - {"--csv"}:
+        media = CORTE_APROVACAO   # sem filtros: abaixo do corte em qualquer turma
+    resultado = consultar_em_risco(media, numero("--faltantes", int), numero("--turma", int),
+                                   numero("--atividade", int), numero("--nota", float))
+    for r in resultado:
+        print(formatar_em_risco(r))
+    if "--csv" in opcoes:
+        exportar_em_risco(resultado, opcoes["--csv"])
+        print(f"✅ {len(resultado)} alunos exportados para {opcoes['--csv']}.")
+    return 0
+
+COMANDOS = {
+    "verificar": cmd_verificar,
+    "arquivar": cmd_arquivar,
+    "snapshots": cmd_snapshots,
+    "comparar": cmd_comparar,
+    "restaurar-turma": cmd_restaurar_turma,
+    "restaurar-aluno": cmd_restaurar_aluno,
+    "converter": cmd_converter,
+    "converter-dados": cmd_converter_dados,
+    "exportar-colunar": cmd_exportar_colunar,
+    "relatorio-colunar": cmd_relatorio_colunar,
+    "em-risco": cmd_em_risco,
+}
+
+def executar_comando(argv):
+    cmd = COMANDOS.get(argv[0])
+    if not cmd:
+        print(f"Comando desconhecido: {argv[0]}. Comandos: {', '.join(COMANDOS)}")
+        return 2
+    try:
+        return cmd(argv[1:])
+    except IndexError:
+        print(f"Faltam argumentos para '{argv[0]}'.")
+        return 2
+    except (ValueError, KeyError, OSError) as e:
+        print(f"❌ {e.args[0] if e.args else e}")
+        return 1
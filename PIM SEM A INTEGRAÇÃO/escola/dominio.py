@@ -0,0 +1,832 @@
+# escola/dominio.py - rankings, cadastros (professores, alunos, turmas, atividades e notas), planilha e integridade
+import bisect
+import getpass
+
+from . import armazenamento
+from .utilitarios import confirma, hash_senha, input_float, input_int, paginar
+from .armazenamento import (
+    ARQ_ATIV, abrir_periodo, abrir_turma, alunos, ao_alterar_dados, atividades, buscar_aluno_por_id,
+    buscar_atividade_por_id, buscar_professor_por_id, buscar_turma_por_id, carregar_tudo,
+    invalidar_indices, professores, prox_id, salvar_arquivo, salvar_tudo, trava_arquivos, turmas,
+)
+
+# =========== NOTAS E RANKINGS (INCREMENTAIS) ===========
+CORTE_APROVACAO = 6.0
+
+# Os rankings são montados uma vez (na primeira consulta) e depois mantidos
+# a cada nota lançada/removida por definir_nota(). Alterações estruturais
+# (remoções, dados vindos de outro terminal) apenas invalidam e o próximo
+# pedido remonta tudo.
+class Ranking:
+    # lista ordenada de (valor, id): top/bottom-k e percentil sem recalcular
+    def __init__(self, pares=()):
+        self._valor = dict(pares)
+        self._ordem = sorted((v, k) for k, v in self._valor.items())
+
+    def __len__(self):
+        return len(self._ordem)
+
+    def __contains__(self, chave):
+        return chave in self._valor
+
+    def valor(self, chave):
+        return self._valor.get(chave)
+
+    def atualizar(self, chave, valor):
+        self.remover(chave)
+        if valor is not None:
+            self._valor[chave] = valor
+            bisect.insort(self._ordem, (valor, chave))
+
+    def remover(self, chave):
+        v = self._valor.pop(chave, None)
+        if v is not None:
+            del self._ordem[bisect.bisect_left(self._ordem, (v, chave))]
+
+    def topo(self, k):
+        return [(c, v) for v, c in reversed(self._ordem[-k:])] if k > 0 else []
+
+    def base(self, k):
+        return [(c, v) for v, c in self._ordem[:k]]
+
+    def abaixo_de(self, limite):
+        return [(c, v) for v, c in self._ordem[:bisect.bisect_left(self._ordem, (limite,))]]
+
+    def acima_de(self, limite):
+        return [(c, v) for v, c in self._ordem[bisect.bisect_right(self._ordem, (limite, float("inf"))):]]
+
+    def percentil(self, chave):
+        # percentil "médio": % de valores menores + metade dos empatados
+        v = self._valor.get(chave)
+        if v is None:
+            return None
+        menores = bisect.bisect_left(self._ordem, (v,))
+        iguais = bisect.bisect_right(self._ordem, (v, float("inf"))) - menores
+        return 100.0 * (menores + 0.5 * iguais) / len(self._ordem)
+
+_rk = None
+
+@ao_alterar_dados
+def invalidar_rankings():
+    global _rk
+    _rk = None
+
+def _agregado_na_turma(t, aid):
+    # (média, atividades sem nota) do aluno na turma
+    ativs = [atv for atv in map(buscar_atividade_por_id, t.get("atividades", [])) if atv]
+    notas = [atv["notas"][str(aid)] for atv in ativs
+             if isinstance(atv.get("notas", {}).get(str(aid)), (int, float))]
+    return (sum(notas) / len(notas) if notas else None), len(ativs) - len(notas)
+
+def rankings():
+    global _rk
+    if _rk is None:
+        abrir_periodo()
+        por_atividade = {}
+        for atv in atividades:
+            # chaves que não são id de aluno ("Nota de aluno inexistente" na integridade) ficam de fora
+            por_atividade[atv["id"]] = Ranking((int(sid), nota) for sid, nota in atv.get("notas", {}).items()
+                                               if sid.isdigit() and isinstance(nota, (int, float)))
+        medias = {}
+        por_turma = {}
+        faltantes = {}
+        for t in turmas:
+            ativs = [atv for atv in map(buscar_atividade_por_id, t.get("atividades", [])) if atv]
+            somas = {}
+            for aid in t["alunos"]:
+                for atv in ativs:
+                    nota = atv.get("notas", {}).get(str(aid))
+                    if isinstance(nota, (int, float)):
+                        s = somas.setdefault(aid, [0.0, 0])
+                        s[0] += nota
+                        s[1] += 1
+            pares = {aid: s[0] / s[1] for aid, s in somas.items()}
+            for aid, media in pares.items():
+                medias.setdefault(aid, {})[t["id"]] = media
+            por_turma[t["id"]] = Ranking(pares)
+            faltantes[t["id"]] = Ranking((aid, len(ativs) - somas.get(aid, (0, 0))[1]) for aid in t["alunos"])
+        _rk = {"atividade": por_atividade,
+               "turma": por_turma,
+               "faltantes": faltantes,
+               "medias": medias,
+               "escola": Ranking((aid, sum(m.values()) / len(m)) for aid, m in medias.items())}
+    return _rk
+
+def definir_nota(atv, aluno_id, nota):
+    # nota None = remover
+    sid = str(aluno_id)
+    notas = atv.setdefault("notas", {})
+    if nota is None:
+        notas.pop(sid, None)
+    else:
+        notas[sid] = nota
+    if _rk is None:
+        return
+    _rk["atividade"].setdefault(atv["id"], Ranking()).atualizar(aluno_id, nota)
+    t = buscar_turma_por_id(atv["turma_id"])
+    if not t or aluno_id not in t["alunos"]:
+        return
+    media, sem_nota = _agregado_na_turma(t, aluno_id)
+    _rk["turma"].setdefault(t["id"], Ranking()).atualizar(aluno_id, media)
+    _rk["faltantes"].setdefault(t["id"], Ranking()).atualizar(aluno_id, sem_nota)
+    m = _rk["medias"].setdefault(aluno_id, {})
+    if media is None:
+        m.pop(t["id"], None)
+    else:
+        m[t["id"]] = media
+    _rk["escola"].atualizar(aluno_id, sum(m.values()) / len(m) if m else None)
+
+# =========== MÓDULO PROFESSORES ===========
+def listar_professores():
+    print("\n=== PROFESSORES ===")
+    if not professores:
+        print("Nenhum professor cadastrado.")
+        return
+    for p in professores:
+        print(f"{p['id']} - {p['nome']} (Matrícula: {p['matricula']})")
+
+def cadastrar_professor():
+    print("\n=== CADASTRAR PROFESSOR ===")
+    nome = input("Nome: ").strip()
+    matricula = input("Matrícula: ").strip()
+    senha = getpass.getpass("Senha: ")
+    if any(p["matricula"].lower() == matricula.lower() for p in professores):
+        print("❌ Matrícula já cadastrada.")
+        return
+    pid = prox_id(professores)
+    professores.append({"id": pid, "nome": nome, "matricula": matricula, "senha": hash_senha(senha)})
+    salvar_arquivo(armazenamento.ARQ_PROF, professores)
+    print("✅ Professor cadastrado.")
+
+def editar_professor():
+    listar_professores()
+    if not professores: return
+    pid = input_int("ID do professor para editar (0 para cancelar): ", min_val=0)
+    if pid == 0: return
+    p = buscar_professor_por_id(pid)
+    if not p:
+        print("❌ Professor não encontrado.")
+        return
+    print("Deixe em branco para manter o valor atual.")
+    novo_nome = input(f"Nome ({p['nome']}): ").strip()
+    nova_mat = input(f"Matrícula ({p['matricula']}): ").strip()
+    trocar_senha = input("Alterar senha? (s/n): ").strip().lower()
+    if novo_nome: p["nome"] = novo_nome
+    if nova_mat: p["matricula"] = nova_mat
+    if trocar_senha in ("s","y"):
+        s = getpass.getpass("Nova senha: ")
+        p["senha"] = hash_senha(s)
+    salvar_arquivo(armazenamento.ARQ_PROF, professores)
+    print("✅ Professor atualizado.")
+
+def remover_professor():
+    listar_professores()
+    if not professores: return
+    pid = input_int("ID do professor para remover (0 para cancelar): ", min_val=0)
+    if pid == 0: return
+    p = buscar_professor_por_id(pid)
+    if not p:
+        print("❌ Professor não encontrado.")
+        return
+    if confirma(f"Remover {p['nome']}? (s/n): "):
+        professores.remove(p)
+        salvar_arquivo(armazenamento.ARQ_PROF, professores)
+        print("✅ Professor removido.")
+
+# =========== MÓDULO ALUNOS ===========
+def formatar_aluno(a):
+    return f"{a['id']} - {a['matricula']} - {a['nome']}"
+
+def listar_alunos_da_turma(t, titulo, formatar=formatar_aluno):
+    roster = [a for a in map(buscar_aluno_por_id, t["alunos"]) if a]
+    paginar(titulo, roster, formatar, vazio="Nenhum aluno matriculado nesta turma.")
+
+def listar_alunos():
+    paginar("ALUNOS", alunos, formatar_aluno, vazio="Nenhum aluno cadastrado.")
+
+def cadastrar_aluno():
+    print("\n=== CADASTRAR ALUNO ===")
+    nome = input("Nome: ").strip()
+    matricula = input("Matrícula: ").strip()
+    if any(x["matricula"].lower() == matricula.lower() for x in alunos):
+        print("❌ Matrícula já cadastrada.")
+        return
+    aid = prox_id(alunos)
+    alunos.append({"id": aid, "nome": nome, "matricula": matricula})
+    salvar_arquivo(armazenamento.ARQ_ALUN, alunos)
+    print("✅ Aluno cadastrado.")
+
+def editar_aluno():
+    listar_alunos()
+    if not alunos: return
+    aid = input_int("ID do aluno para editar (0 cancelar): ", min_val=0)
+    if aid == 0: return
+    a = buscar_aluno_por_id(aid)
+    if not a:
+        print("❌ Aluno não encontrado.")
+        return
+    novo_nome = input(f"Nome ({a['nome']}): ").strip()
+    nova_mat = input(f"Matrícula ({a['matricula']}): ").strip()
+    if novo_nome: a['nome'] = novo_nome
+    if nova_mat: a['matricula'] = nova_mat
+    salvar_arquivo(armazenamento.ARQ_ALUN, alunos)
+    print("✅ Aluno atualizado.")
+
+def remover_aluno():
+    listar_alunos()
+    if not alunos: return
+    aid = input_int("ID do aluno para remover (0 cancelar): ", min_val=0)
+    if aid == 0: return
+    a = buscar_aluno_por_id(aid)
+    if not a:
+        print("❌ Aluno não encontrado.")
+        return
+    if confirma(f"Remover {a['nome']}? (s/n): "):
+        # remover de turmas
+        for t in turmas:
+            if aid in t["alunos"]:
+                t["alunos"].remove(aid)
+        # remover notas nas atividades (chave como str)
+        abrir_periodo()
+        for atv in atividades:
+            if str(aid) in atv.get("notas", {}):
+                del atv["notas"][str(aid)]
+        alunos.remove(a)
+        invalidar_rankings()
+        salvar_tudo()
+        print("✅ Aluno removido.")
+
+def buscar_aluno():
+    q = input("Digite nome ou matrícula para buscar: ").strip().lower()
+    encontrados = [a for a in alunos if q in a["nome"].lower() or q in a["matricula"].lower()]
+    paginar("ALUNOS ENCONTRADOS", encontrados, formatar_aluno, vazio="Nenhum aluno encontrado.")
+
+def ver_turmas_do_aluno():
+    listar_alunos()
+    if not alunos: return
+    aid = input_int("ID do aluno para ver turmas (0 cancelar): ", min_val=0)
+    if aid == 0: return
+    a = buscar_aluno_por_id(aid)
+    if not a:
+        print("Aluno não encontrado.")
+        return
+    turmas_do_aluno = [t for t in turmas if aid in t["alunos"]]
+    if not turmas_do_aluno:
+        print("Aluno não está matriculado em nenhuma turma.")
+        return
+    print(f"Turmas de {a['nome']}:")
+    for t in turmas_do_aluno:
+        print(f"{t['id']} - {t['nome']}")
+
+# =========== MÓDULO TURMAS ===========
+def listar_turmas():
+    paginar("TURMAS", turmas,
+            lambda t: f"{t['id']} - {t['nome']} (alunos: {len(t['alunos'])}, atividades: {len(t.get('atividades',[]))})",
+            vazio="Nenhuma turma cadastrada.")
+
+def cadastrar_turma():
+    print("\n=== CADASTRAR TURMA ===")
+    nome = input("Nome da turma: ").strip()
+    tid = prox_id(turmas)
+    turmas.append({"id": tid, "nome": nome, "alunos": [], "atividades": []})
+    salvar_arquivo(armazenamento.ARQ_TURM, turmas)
+    print("✅ Turma cadastrada.")
+
+def editar_turma():
+    listar_turmas()
+    if not turmas: return
+    tid = input_int("ID da turma para editar (0 cancelar): ", min_val=0)
+    if tid == 0: return
+    t = buscar_turma_por_id(tid)
+    if not t:
+        print("Turma não encontrada.")
+        return
+    novo_nome = input(f"Nome ({t['nome']}): ").strip()
+    if novo_nome: t['nome'] = novo_nome
+    salvar_arquivo(armazenamento.ARQ_TURM, turmas)
+    print("✅ Turma atualizada.")
+
+def remover_turma():
+    listar_turmas()
+    if not turmas: return
+    tid = input_int("ID da turma para remover (0 cancelar): ", min_val=0)
+    if tid == 0: return
+    t = buscar_turma_por_id(tid)
+    if not t:
+        print("Turma não encontrada.")
+        return
+    if confirma(f"Remover turma {t['nome']} e todas as atividades associadas? (s/n): "):
+        # remover atividades associadas
+        abrir_turma(tid)
+        atv_to_remove = [a for a in atividades if a["turma_id"] == tid]
+        for a in atv_to_remove:
+            atividades.remove(a)
+        turmas.remove(t)
+        invalidar_rankings()
+        salvar_tudo()
+        print("✅ Turma e atividades removidas.")
+
+def ver_alunos_da_turma():
+    listar_turmas()
+    if not turmas: return
+    tid = input_int("ID da turma (0 cancelar): ", min_val=0)
+    if tid == 0: return
+    t = buscar_turma_por_id(tid)
+    if not t:
+        print("Turma não encontrada.")
+        return
+    listar_alunos_da_turma(t, f"Alunos da {t['nome']}")
+
+def ver_atividades_da_turma():
+    listar_turmas()
+    if not turmas: return
+    tid = input_int("ID da turma (0 cancelar): ", min_val=0)
+    if tid == 0: return
+    t = buscar_turma_por_id(tid)
+    if not t:
+        print("Turma não encontrada.")
+        return
+    ativs = [atv for atv in map(buscar_atividade_por_id, t.get("atividades", [])) if atv]
+    paginar(f"Atividades da {t['nome']}", ativs,
+            lambda atv: f"{atv['id']} - {atv['nome']} - {atv.get('descricao', '')}",
+            vazio="Nenhuma atividade nesta turma.")
+
+def matricular_aluno_em_turma():
+    listar_alunos()
+    if not alunos: return
+    aid = input_int("ID do aluno (0 cancelar): ", min_val=0)
+    if aid == 0: return
+    a = buscar_aluno_por_id(aid)
+    if not a:
+        print("Aluno não encontrado.")
+        return
+    listar_turmas()
+    if not turmas: return
+    tid = input_int("ID da turma (0 cancelar): ", min_val=0)
+    if tid == 0: return
+    t = buscar_turma_por_id(tid)
+    if not t:
+        print("Turma não encontrada.")
+        return
+    if aid in t["alunos"]:
+        print("Aluno já matriculado.")
+        return
+    t["alunos"].append(aid)
+    invalidar_rankings()
+    salvar_tudo()
+    print("✅ Matriculado com sucesso.")
+
+def desmatricular_aluno():
+    listar_turmas()
+    if not turmas: return
+    tid = input_int("ID da turma (0 cancelar): ", min_val=0)
+    if tid == 0: return
+    t = buscar_turma_por_id(tid)
+    if not t:
+        print("Turma não encontrada.")
+        return
+    if not t["alunos"]:
+        print("Nenhum aluno na turma.")
+        return
+    listar_alunos_da_turma(t, "Alunos")
+    aid = input_int("ID do aluno para desmatricular (0 cancelar): ", min_val=0)
+    if aid == 0: return
+    if aid not in t["alunos"]:
+        print("Aluno não está matriculado nessa turma.")
+        return
+    t["alunos"].remove(aid)
+    # remover notas desse aluno nas atividades da turma
+    for atv_id in list(t.get("atividades", [])):
+        atv = buscar_atividade_por_id(atv_id)
+        if atv and str(aid) in atv.get("notas", {}):
+            del atv["notas"][str(aid)]
+    invalidar_rankings()
+    salvar_tudo()
+    print("✅ Desmatriculado.")
+
+# =========== MÓDULO ATIVIDADES E NOTAS (com descrição) ===========
+def formatar_atividade(a):
+    t = buscar_turma_por_id(a["turma_id"])
+    nome_t = t["nome"] if t else "N/D"
+    return f"{a['id']} - {a['nome']} (Turma: {nome_t}) - {a.get('descricao', '')}"
+
+def listar_atividades():
+    # no modo por período a turma é escolhida antes: só a partição dela é aberta
+    if not armazenamento._periodo:
+        paginar("ATIVIDADES", atividades, formatar_atividade, vazio="Nenhuma atividade cadastrada.")
+        return atividades
+    listar_turmas()
+    if not turmas: return []
+    tid = input_int("ID da turma (0 cancelar): ", min_val=0)
+    if tid == 0: return []
+    t = buscar_turma_por_id(tid)
+    if not t:
+        print("Turma não encontrada.")
+        return []
+    abrir_turma(tid)
+    lista = [a for a in map(buscar_atividade_por_id, t.get("atividades", [])) if a]
+    paginar(f"ATIVIDADES DA TURMA {t['nome']}", lista, formatar_atividade,
+            vazio="Nenhuma atividade nesta turma.")
+    return lista
+
+def escolher_atividade(texto="ID da atividade (0 cancelar): "):
+    if not listar_atividades(): return None
+    aid = input_int(texto, min_val=0)
+    if aid == 0: return None
+    atv = buscar_atividade_por_id(aid)
+    if not atv:
+        print("Atividade não encontrada.")
+    return atv
+
+def cadastrar_atividade():
+    listar_turmas()
+    if not turmas: return
+    tid = input_int("ID da turma que receberá a atividade (0 cancelar): ", min_val=0)
+    if tid == 0: return
+    t = buscar_turma_por_id(tid)
+    if not t:
+        print("Turma não encontrada.")
+        return
+    nome = input("Nome da atividade: ").strip()
+    descricao = input("Descrição (resumo): ").strip()
+    abrir_turma(tid)
+    aid = prox_id(atividades)
+    atv = {"id": aid, "nome": nome, "descricao": descricao, "turma_id": tid, "notas": {}}
+    atividades.append(atv)
+    t.setdefault("atividades", []).append(aid)
+    invalidar_rankings()
+    salvar_tudo()
+    print("✅ Atividade cadastrada.")
+
+def editar_atividade():
+    atv = escolher_atividade("ID da atividade para editar (0 cancelar): ")
+    if not atv: return
+    novo_nome = input(f"Nome ({atv['nome']}): ").strip()
+    nova_descr = input(f"Descrição ({atv.get('descricao','')}): ").strip()
+    if novo_nome: atv["nome"] = novo_nome
+    if nova_descr: atv["descricao"] = nova_descr
+    salvar_arquivo(ARQ_ATIV, atividades)
+    print("✅ Atividade atualizada.")
+
+def remover_atividade():
+    atv = escolher_atividade("ID da atividade para remover (0 cancelar): ")
+    if not atv: return
+    aid = atv["id"]
+    if confirma(f"Remover atividade '{atv['nome']}'? (s/n): "):
+        # remover referência da turma
+        t = buscar_turma_por_id(atv["turma_id"])
+        if t and aid in t.get("atividades", []):
+            t["atividades"].remove(aid)
+        atividades.remove(atv)
+        invalidar_rankings()
+        salvar_tudo()
+        print("✅ Atividade removida.")
+
+def ver_notas_atividade():
+    atv = escolher_atividade()
+    if not atv: return
+    mostrar_notas(atv)
+
+def mostrar_notas(atv):
+    def formatar(item):
+        sid, nota = item
+        # chaves que não são id de aluno aparecem como estão (a integridade aponta)
+        aluno = buscar_aluno_por_id(int(sid)) if sid.isdigit() else None
+        nome = aluno["nome"] if aluno else sid
+        return f"{sid} - {nome} : {nota}"
+    paginar(f"Notas da atividade {atv['nome']}", list(atv.get("notas", {}).items()), formatar,
+            chave=lambda item: int(item[0]) if item[0].isdigit() else item[0], vazio="Sem notas registradas.")
+
+def adicionar_editar_nota():
+    atv = escolher_atividade()
+    if not atv: return
+    t = buscar_turma_por_id(atv["turma_id"])
+    if not t:
+        print("Turma da atividade não encontrada.")
+        return
+    if not t["alunos"]:
+        print("Nenhum aluno matriculado na turma.")
+        return
+    listar_alunos_da_turma(t, "Alunos da turma",
+                           lambda a: f"{formatar_aluno(a)} (nota atual: {atv['notas'].get(str(a['id']), '—')})")
+    aluno_id = input_int("ID do aluno para lançar/editar nota (0 cancelar): ", min_val=0)
+    if aluno_id == 0: return
+    if aluno_id not in t["alunos"]:
+        print("Aluno não pertence a esta turma.")
+        return
+    nota = input_float("Nota (0-10): ", min_val=0.0, max_val=10.0)
+    definir_nota(atv, aluno_id, nota)
+    salvar_arquivo(ARQ_ATIV, atividades)
+    print("✅ Nota registrada/atualizada.")
+
+def remover_nota():
+    atv = escolher_atividade()
+    if not atv: return
+    mostrar_notas(atv)
+    aluno_id = input("Digite o ID do aluno para remover nota (ou vazio para cancelar): ").strip()
+    if aluno_id == "": return
+    if aluno_id.isdigit() and aluno_id in atv.get("notas", {}):
+        if confirma("Remover nota? (s/n): "):
+            definir_nota(atv, int(aluno_id), None)
+            salvar_arquivo(ARQ_ATIV, atividades)
+            print("✅ Nota removida.")
+    else:
+        print("Nenhuma nota encontrada para esse aluno nesta atividade.")
+
+# =========== PLANILHA DE NOTAS (LANÇAMENTO EM LOTE) ===========
+# Lança as notas de uma atividade para a turma inteira e grava uma única vez.
+# Em cada lote, None significa "remover a nota".
+def _ler_nota(txt):
+    txt = txt.strip()
+    if txt == "-":
+        return None
+    nota = float(txt.replace(",", "."))
+    if not 0.0 <= nota <= 10.0:
+        raise ValueError("fora de 0-10")
+    return nota
+
+def _planilha_por_chamada(t, atv):
+    print("Enter mantém a nota atual, '-' remove, 'q' encerra a chamada.")
+    lote = {}
+    for aid in t["alunos"]:
+        a = buscar_aluno_por_id(aid)
+        if not a:
+            continue
+        atual = atv["notas"].get(str(aid), "—")
+        while True:
+            v = input(f"{a['matricula']} - {a['nome']} (atual: {atual}): ").strip()
+            if v == "":
+                break
+            if v.lower() == "q":
+                return lote
+            try:
+                lote[str(aid)] = _ler_nota(v)
+                break
+            except ValueError:
+                print("Nota inválida (0-10, use . ou ,; '-' remove).")
+    return lote
+
+def _separar(l, virgula=False):
+    for sep in (",",) if virgula else (";", "\t"):
+        if sep in l:
+            ident, _, nota = l.partition(sep)
+            break
+    else:
+        ident, _, nota = l.partition(" ")
+    return ident.strip(), nota.strip()
+
+def _e_numero(txt):
+    try:
+        float(txt.replace(",", "."))
+        return True
+    except ValueError:
+        return txt == "-"
+
+def _coluna_valida(linhas, roster):
+    try:
+        return len(linhas) == len(roster) and all(_ler_nota(l) is not None for l in linhas)
+    except ValueError:
+        return False
+
+def _interpretar_planilha(linhas, t):
+    # aceita "matrícula;nota", "ID;nota" (também com tab, espaço ou vírgula)
+    # ou uma coluna só de notas, na ordem dos alunos da turma
+    roster = [a for a in map(buscar_aluno_por_id, t["alunos"]) if a]
+    por_matricula = {a["matricula"].lower(): a["id"] for a in roster}
+    matriculados = set(t["alunos"])
+    def da_turma(ident):
+        ident = ident.strip().lower()
+        return ident in por_matricula or (ident.isdigit() and int(ident) in matriculados)
+    linhas = [l.strip() for l in linhas if l.strip()]
+    lote, erros = {}, []
+    uma_coluna = linhas and all(len(l.split()) == 1 and ";" not in l for l in linhas)
+    # sem ";", tab ou espaço, "9,7" tanto pode ser a nota 9,7 quanto o aluno 9 com nota 7
+    # (CSV com vírgula): é CSV quando algum texto antes da vírgula é aluno da turma
+    virgula = uma_coluna and any(da_turma(l.partition(",")[0]) for l in linhas if "," in l)
+    uma_coluna = uma_coluna and not virgula
+    inicio, cabecalho = 1, ""
+    # a primeira linha só é cabeçalho se o campo da nota não for um número;
+    # qualquer outra linha que não se encaixe é erro
+    if linhas and not _e_numero(linhas[0] if uma_coluna else _separar(linhas[0], virgula)[1]):
+        cabecalho, linhas, inicio = linhas[0], linhas[1:], 2
+    if virgula and "," not in cabecalho and all(l.partition(",")[0].isdigit() for l in linhas) and _coluna_valida(linhas, roster):
+        # também seria uma coluna válida de notas com vírgula decimal: não dá para adivinhar
+        return {}, ["As linhas podem ser 'ID,nota' ou notas com vírgula decimal. "
+                    "Separe ID e nota com ';' ou use '.' nas notas."]
+    if uma_coluna:
+        if len(linhas) != len(roster):
+            return {}, [f"A coluna tem {len(linhas)} notas, mas a turma tem {len(roster)} alunos."]
+        pares = [(str(a["id"]), l) for a, l in zip(roster, linhas)]
+    else:
+        pares = [_separar(l, virgula) for l in linhas]
+    for n, (ident, txt_nota) in enumerate(pares, start=inicio):
+        if ident.lower() in por_matricula:
+            aid = por_matricula[ident.lower()]
+        elif ident.isdigit() and int(ident) in matriculados:
+            aid = int(ident)
+        else:
+            erros.append(f"Linha {n}: aluno '{ident}' não pertence à turma.")
+            continue
+        try:
+            nota = _ler_nota(txt_nota)
+        except ValueError:
+            erros.append(f"Linha {n}: nota '{txt_nota}' inválida (0-10).")
+            continue
+        if str(aid) in lote:
+            erros.append(f"Linha {n}: aluno '{ident}' repetido.")
+            continue
+        lote[str(aid)] = nota
+    return lote, erros
+
+def _aplicar_planilha(atv, lote):
+    notas = atv.setdefault("notas", {})
+    mudancas = []
+    inalteradas = 0
+    for sid, nova in lote.items():
+        antiga = notas.get(sid)
+        if antiga == nova:
+            inalteradas += 1
+        else:
+            mudancas.append((sid, antiga, nova))
+    novas = sum(1 for _, antiga, nova in mudancas if antiga is None)
+    removidas = sum(1 for _, antiga, nova in mudancas if nova is None)
+    print(f"\nResumo: {novas} novas, {len(mudancas) - novas - removidas} alteradas, "
+          f"{removidas} removidas, {inalteradas} sem alteração.")
+    if not mudancas:
+        return
+    def formatar(m):
+        sid, antiga, nova = m
+        a = buscar_aluno_por_id(int(sid))
+        nome = a["nome"] if a else sid
+        return f"{sid} - {nome}: {'—' if antiga is None else antiga} -> {'—' if nova is None else nova}"
+    paginar("ALTERAÇÕES", mudancas, formatar, chave=lambda m: int(m[0]))
+    if not confirma("Gravar estas alterações? (s/n): "):
+        print("Nada foi gravado.")
+        return
+    for sid, _, nova in mudancas:
+        definir_nota(atv, int(sid), nova)
+    salvar_arquivo(ARQ_ATIV, atividades)
+    print(f"✅ {len(mudancas)} nota(s) gravada(s).")
+
+def lancar_notas_em_lote():
+    atv = escolher_atividade()
+    if not atv: return
+    t = buscar_turma_por_id(atv["turma_id"])
+    if not t:
+        print("Turma da atividade não encontrada.")
+        return
+    if not t["alunos"]:
+        print("Nenhum aluno matriculado na turma.")
+        return
+    print(f"\nPlanilha de notas: {atv['nome']} - Turma {t['nome']} ({len(t['alunos'])} alunos)")
+    print("1. Percorrer os alunos da turma")
+    print("2. Colar notas (matrícula ou ID;nota, ou só a coluna de notas) - termine com linha vazia")
+    print("3. Importar arquivo CSV/TXT no mesmo formato")
+    modo = input("Escolha: ").strip()
+    if modo == "1":
+        lote, erros = _planilha_por_chamada(t, atv), []
+    elif modo == "2":
+        linhas = []
+        while True:
+            l = input()
+            if not l.strip():
+                break
+            linhas.append(l)
+        lote, erros = _interpretar_planilha(linhas, t)
+    elif modo == "3":
+        caminho = input("Caminho do arquivo: ").strip()
+        try:
+            with open(caminho, "r", encoding="utf-8-sig") as f:
+                linhas = f.readlines()
+        except OSError as e:
+            print(f"❌ Não foi possível ler o arquivo: {e}")
+            return
+        lote, erros = _interpretar_planilha(linhas, t)
+    else:
+        print("Opção inválida.")
+        return
+    if erros:
+        for e in erros:
+            print(f"❌ {e}")
+        print("Nenhuma nota foi gravada. Corrija as linhas acima e tente novamente.")
+        return
+    _aplicar_planilha(atv, lote)
+
+# =========== INTEGRIDADE DOS DADOS ===========
+# Uma passada por coleção usando conjuntos de ids: O(total de registros + notas).
+def verificar_integridade(reparar=False):
+    abrir_periodo()
+    problemas = {}
+    def prob(categoria, descricao):
+        problemas.setdefault(categoria, []).append(descricao)
+
+    for nome, lista in (("professores", professores), ("alunos", alunos), ("turmas", turmas), ("atividades", atividades)):
+        vistos = set()
+        unicos = []
+        for x in lista:
+            if x["id"] in vistos:
+                prob("ID duplicado (mantido o primeiro)", f"{nome} #{x['id']}")
+            else:
+                vistos.add(x["id"])
+                unicos.append(x)
+        if reparar and len(unicos) != len(lista):
+            lista[:] = unicos
+
+    ids_alunos = {a["id"] for a in alunos}
+    atv_por_id = {a["id"]: a for a in atividades}
+    turma_por_id = {t["id"]: t for t in turmas}
+    matriculados = {}
+    listadas = {}
+    for t in turmas:
+        alunos_ok = []
+        vistos = set()
+        for aid in t.get("alunos", []):
+            if aid not in ids_alunos:
+                prob("Turma com aluno inexistente", f"turma #{t['id']} -> aluno #{aid}")
+            elif aid in vistos:
+                prob("Aluno repetido na turma", f"turma #{t['id']} -> aluno #{aid}")
+            else:
+                vistos.add(aid)
+                alunos_ok.append(aid)
+        matriculados[t["id"]] = vistos
+        atvs_ok = []
+        vistos = set()
+        for atv_id in t.get("atividades", []):
+            atv = atv_por_id.get(atv_id)
+            if atv is None:
+                prob("Turma com atividade inexistente", f"turma #{t['id']} -> atividade #{atv_id}")
+            elif atv["turma_id"] != t["id"]:
+                prob("Atividade listada na turma errada", f"turma #{t['id']} -> atividade #{atv_id} (da turma #{atv['turma_id']})")
+            elif atv_id in vistos:
+                prob("Atividade repetida na turma", f"turma #{t['id']} -> atividade #{atv_id}")
+            else:
+                vistos.add(atv_id)
+                atvs_ok.append(atv_id)
+        listadas[t["id"]] = vistos
+        if reparar:
+            t["alunos"] = alunos_ok
+            t["atividades"] = atvs_ok
+
+    orfas = set()
+    for atv in atividades:
+        t = turma_por_id.get(atv.get("turma_id"))
+        if t is None:
+            prob("Atividade de turma inexistente (removida)", f"atividade #{atv['id']} -> turma #{atv.get('turma_id')}")
+            orfas.add(atv["id"])
+            continue
+        if atv["id"] not in listadas[t["id"]]:
+            prob("Atividade fora da lista da turma", f"atividade #{atv['id']} -> turma #{t['id']}")
+            if reparar:
+                t["atividades"].append(atv["id"])
+        if "nota" in atv:
+            prob("Campo 'nota' avulso na atividade", f"atividade #{atv['id']} (nota: {atv['nota']})")
+            if reparar:
+                del atv["nota"]
+        notas = atv.setdefault("notas", {}) if reparar else atv.get("notas", {})
+        for sid, nota in list(notas.items()):
+            if not sid.isdigit() or int(sid) not in ids_alunos:
+                prob("Nota de aluno inexistente", f"atividade #{atv['id']} -> aluno {sid}")
+            elif int(sid) not in matriculados[t["id"]]:
+                prob("Nota de aluno não matriculado na turma", f"atividade #{atv['id']} -> aluno #{sid}")
+            elif isinstance(nota, bool) or not isinstance(nota, (int, float)) or not 0 <= nota <= 10:
+                prob("Nota fora de 0-10 ou não numérica", f"atividade #{atv['id']} -> aluno #{sid}: {nota!r}")
+            else:
+                continue
+            if reparar:
+                del notas[sid]
+
+    if reparar and problemas:
+        if orfas:
+            atividades[:] = [a for a in atividades if a["id"] not in orfas]
+        invalidar_indices()
+        invalidar_rankings()
+    return problemas
+
+def reparar_dados():
+    # recarrega, corrige e grava tudo sob a mesma trava: um único estado consistente
+    with trava_arquivos():
+        carregar_tudo()
+        problemas = verificar_integridade(reparar=True)
+        if problemas:
+            salvar_tudo()
+    return problemas
+
+def imprimir_problemas(problemas, limite=20):
+    if not problemas:
+        print("✅ Nenhum problema de integridade encontrado.")
+        return
+    total = sum(len(v) for v in problemas.values())
+    linhas = [f"⚠️ {total} problema(s) de integridade:"]
+    for categoria, itens in problemas.items():
+        linhas.append(f"\n{categoria}: {len(itens)}")
+        linhas.extend(f"  - {d}" for d in itens[:limite])
+        if len(itens) > limite:
+            linhas.append(f"  ... e mais {len(itens) - limite}")
+    print("\n".join(linhas))
+
+def verificar_integridade_ui():
+    problemas = verificar_integridade()
+    imprimir_problemas(problemas)
+    if problemas and confirma("Reparar agora? (s/n): "):
+        imprimir_problemas(reparar_dados())
+        print("✅ Dados reparados e gravados.")
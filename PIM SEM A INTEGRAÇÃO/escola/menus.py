@@ -0,0 +1,246 @@
+# escola/menus.py - menus, login e o laço principal do programa
+import getpass
+
+from . import armazenamento
+from .utilitarios import hash_senha
+from .armazenamento import (
+    carregar_tudo, consultar_periodo_anterior, encerrar_periodo, organizar_por_periodo, professores,
+    recarregar_alteracoes, salvar_tudo,
+)
+from .dominio import (
+    adicionar_editar_nota, buscar_aluno, cadastrar_aluno, cadastrar_atividade, cadastrar_professor,
+    cadastrar_turma, desmatricular_aluno, editar_aluno, editar_atividade, editar_professor, editar_turma,
+    lancar_notas_em_lote, listar_alunos, listar_atividades, listar_professores, listar_turmas,
+    matricular_aluno_em_turma, remover_aluno, remover_atividade, remover_nota, remover_professor,
+    remover_turma, ver_alunos_da_turma, ver_atividades_da_turma, ver_notas_atividade,
+    ver_turmas_do_aluno, verificar_integridade_ui,
+)
+from .arquivo import arquivo_ui
+from .relatorios import (
+    alunos_em_risco_ui, exportar_notas_colunar_ui, gerar_boletins_pdf, gerar_relatorio_inteligente,
+    gerar_relatorio_texto, gerar_relatorios_pdf_turma, melhor_pior_aluno_turma, rankings_ui,
+)
+
+usuario_logado = None
+
+# =========== MENUS (BONITOS) ===========
+def linha(tam=60):
+    return "-" * tam
+
+def header(title):
+    print("\n" + linha(70))
+    print(f"📚  {title}")
+    print(linha(70))
+
+def escolher_opcao():
+    op = input("Escolha: ").strip()
+    recarregar_alteracoes()
+    return op
+
+def menu_acesso():
+    header("ACESSO AO SISTEMA - Política de Privacidade (LGPD)")
+    print("A escola respeita a Lei Geral de Proteção de Dados (13.709/2018).")
+    print("Os dados são usados apenas para fins educacionais e administrativos.\n")
+    print("1. Cadastrar professor")
+    print("2. Login")
+    print("0. Sair")
+    return escolher_opcao()
+
+def menu_principal():
+    nome = usuario_logado['nome'] if usuario_logado else "Nenhum"
+    header(f"SISTEMA ESCOLAR - Professor: {nome}")
+    print("1. Gerenciar Alunos")
+    print("2. Turmas")
+    print("3. Atividades e Notas")
+    print("4. Relatórios e PDFs")
+    print("5. Logout")
+    print("0. Sair")
+    return escolher_opcao()
+
+def menu_professores_ui():
+    header("PROFESSORES")
+    print("1. Listar professores")
+    print("2. Cadastrar professor")
+    print("3. Editar professor")
+    print("4. Remover professor")
+    print("0. Voltar")
+    return escolher_opcao()
+
+def menu_alunos_ui():
+    header("ALUNOS")
+    print("1. Listar alunos")
+    print("2. Cadastrar aluno")
+    print("3. Editar aluno")
+    print("4. Remover aluno")
+    print("5. Buscar aluno")
+    print("6. Ver turmas do aluno")
+    print("0. Voltar")
+    return escolher_opcao()
+
+def menu_turmas_ui():
+    header("TURMAS")
+    print("1. Listar turmas")
+    print("2. Cadastrar turma")
+    print("3. Editar turma")
+    print("4. Remover turma")
+    print("5. Ver alunos da turma")
+    print("6. Ver atividades da turma")
+    print("7. Matricular aluno")
+    print("8. Desmatricular aluno")
+    print("9. Períodos letivos")
+    print("0. Voltar")
+    return escolher_opcao()
+
+def menu_periodos_ui():
+    header(f"PERÍODOS LETIVOS - Atual: {armazenamento._periodo or 'arquivos únicos'}")
+    print("1. Organizar dados por período")
+    print("2. Encerrar período atual e iniciar outro")
+    print("3. Consultar período anterior (somente leitura)")
+    print("4. Arquivo: snapshot, comparação e restauração")
+    print("0. Voltar")
+    return escolher_opcao()
+
+def menu_atividades_ui():
+    header("ATIVIDADES E NOTAS")
+    print("1. Listar atividades")
+    print("2. Cadastrar atividade (com descrição)")
+    print("3. Editar atividade")
+    print("4. Remover atividade")
+    print("5. Ver notas de uma atividade")
+    print("6. Adicionar/editar nota")
+    print("7. Remover nota")
+    print("8. Lançar notas da turma (planilha)")
+    print("0. Voltar")
+    return escolher_opcao()
+
+def menu_relatorios_ui():
+    header("RELATÓRIOS E PDFS")
+    print("1. Gerar relatório (texto) por turma")
+    print("2. Gerar relatório (PDF) por turma")
+    print("3. Gerar boletins em PDF (um por aluno)")
+    print("4. Relatório inteligente (médias por turma)")
+    print("5. Melhor/pior aluno por turma")
+    print("6. Rankings e percentis (turma, atividade, escola)")
+    print("7. Verificar integridade dos dados")
+    print("8. Exportar notas em colunas (para relatórios em paralelo)")
+    print("9. Alunos em risco (média baixa, notas faltando)")
+    print("0. Voltar")
+    return escolher_opcao()
+
+# =========== LOGIN / EXECUÇÃO ===========
+def login_professor_interface():
+    global usuario_logado
+    header("LOGIN")
+    matricula = input("Matrícula: ").strip()
+    senha = getpass.getpass("Senha: ")
+    for p in professores:
+        if p["matricula"] == matricula and p["senha"] == hash_senha(senha):
+            usuario_logado = p
+            print(f"✅ Bem-vindo, {p['nome']}!")
+            return True
+    print("❌ Matrícula ou senha inválida.")
+    return False
+
+def logout_professor():
+    global usuario_logado
+    usuario_logado = None
+    print("🔒 Logout realizado.")
+
+def main():
+    carregar_tudo()
+    while True:
+        op = menu_acesso()
+        if op == "1":
+            cadastrar_professor()
+        elif op == "2":
+            if login_professor_interface():
+                break
+        elif op == "0":
+            print("Saindo...")
+            return
+        else:
+            print("Opção inválida.")
+
+    # menu principal
+    while True:
+        op = menu_principal()
+        if op == "1":
+            while True:
+                sub = menu_professores_ui()
+                if sub == "1": listar_professores()
+                elif sub == "2": cadastrar_professor()
+                elif sub == "3": editar_professor()
+                elif sub == "4": remover_professor()
+                elif sub == "0": break
+                else: print("Inválido.")
+        elif op == "2":
+            while True:
+                sub = menu_alunos_ui()
+                if sub == "1": listar_alunos()
+                elif sub == "2": cadastrar_aluno()
+                elif sub == "3": editar_aluno()
+                elif sub == "4": remover_aluno()
+                elif sub == "5": buscar_aluno()
+                elif sub == "6": ver_turmas_do_aluno()
+                elif sub == "0": break
+                else: print("Inválido.")
+        elif op == "3":
+            while True:
+                sub = menu_turmas_ui()
+                if sub == "1": listar_turmas()
+                elif sub == "2": cadastrar_turma()
+                elif sub == "3": editar_turma()
+                elif sub == "4": remover_turma()
+                elif sub == "5": ver_alunos_da_turma()
+                elif sub == "6": ver_atividades_da_turma()
+                elif sub == "7": matricular_aluno_em_turma()
+                elif sub == "8": desmatricular_aluno()
+                elif sub == "9":
+                    while True:
+                        sub_p = menu_periodos_ui()
+                        if sub_p == "1": organizar_por_periodo()
+                        elif sub_p == "2": encerrar_periodo()
+                        elif sub_p == "3": consultar_periodo_anterior()
+                        elif sub_p == "4": arquivo_ui()
+                        elif sub_p == "0": break
+                        else: print("Inválido.")
+                elif sub == "0": break
+                else: print("Inválido.")
+        elif op == "4":
+            while True:
+                sub = menu_atividades_ui()
+                if sub == "1": listar_atividades()
+                elif sub == "2": cadastrar_atividade()
+                elif sub == "3": editar_atividade()
+                elif sub == "4": remover_atividade()
+                elif sub == "5": ver_notas_atividade()
+                elif sub == "6": adicionar_editar_nota()
+                elif sub == "7": remover_nota()
+                elif sub == "8": lancar_notas_em_lote()
+                elif sub == "0": break
+                else: print("Inválido.")
+        elif op == "5":
+            while True:
+                sub = menu_relatorios_ui()
+                if sub == "1": gerar_relatorio_texto()
+                elif sub == "2": gerar_relatorios_pdf_turma()
+                elif sub == "3": gerar_boletins_pdf()
+                elif sub == "4": gerar_relatorio_inteligente()
+                elif sub == "5": melhor_pior_aluno_turma()
+                elif sub == "6": rankings_ui()
+                elif sub == "7": verificar_integridade_ui()
+                elif sub == "8": exportar_notas_colunar_ui()
+                elif sub == "9": alunos_em_risco_ui()
+                elif sub == "0": break
+                else: print("Inválido.")
+        elif op == "6":
+            logout_professor()
+            salvar_tudo()
+            main()  # reinicia fluxo de login
+            return
+        elif op == "0":
+            salvar_tudo()
+            print("Saindo...")
+            return
+        else:
+            print("Opção inválida.")
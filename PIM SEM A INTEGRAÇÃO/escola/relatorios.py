@@ -0,0 +1,535 @@
+# escola/relatorios.py - relatórios em texto e PDF, boletins, alunos em risco e notas em colunas
+import bisect
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+
+from . import armazenamento
+from .utilitarios import confirma, input_float, input_int, paginar
+from .armazenamento import (
+    ARQ_COLUNAR, PASTA_DADOS, _ler_disco, abrir_periodo, alunos, buscar_aluno_por_id,
+    buscar_atividade_por_id, buscar_turma_por_id, localizar_dados, turmas,
+)
+from .dominio import CORTE_APROVACAO, Ranking, escolher_atividade, listar_turmas, rankings
+
+# =========== RELATÓRIOS ===========
+
+def gerar_relatorio_texto():
+    listar_turmas()
+    if not turmas: return
+    tid = input_int("ID da turma para relatório (0 cancelar): ", min_val=0)
+    if tid == 0: return
+    t = buscar_turma_por_id(tid)
+    if not t:
+        print("Turma não encontrada.")
+        return
+    print(f"\nRelatório da Turma {t['nome']}")
+    if not t["alunos"]:
+        print("Sem alunos matriculados.")
+        return
+    for aid in t["alunos"]:
+        a = buscar_aluno_por_id(aid)
+        if not a:
+            continue
+        notas = []
+        for atv_id in t.get("atividades", []):
+            atv = buscar_atividade_por_id(atv_id)
+            if atv and str(aid) in atv.get("notas", {}):
+                notas.append(f"{atv['nome']}: {atv['notas'][str(aid)]}")
+        print(f"{a['matricula']} - {a['nome']} -> {' | '.join(notas) if notas else 'Sem notas'}")
+
+def _reportlab():
+    # o ReportLab só é importado quando um PDF é pedido: sozinho ele custa
+    # mais que todo o resto do início do programa
+    try:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.units import cm
+        from reportlab.pdfgen import canvas
+    except ImportError:
+        print("❌ Para gerar PDFs instale o ReportLab: pip install reportlab")
+        return None
+    return letter, canvas, cm
+
+def gerar_relatorios_pdf_turma():
+    rl = _reportlab()
+    if not rl: return
+    letter, canvas, _ = rl
+    listar_turmas()
+    if not turmas: return
+    tid = input_int("ID da turma para gerar PDF (0 cancelar): ", min_val=0)
+    if tid == 0: return
+    t = buscar_turma_por_id(tid)
+    if not t:
+        print("Turma não encontrada.")
+        return
+    filename = f"relatorio_turma_{t['id']}.pdf"
+    c = canvas.Canvas(filename, pagesize=letter)
+    c.setFont("Helvetica-Bold", 14)
+    width, height = letter
+    y = height - 50
+    c.drawString(50, y, f"Relatório - Turma {t['nome']}")
+    y -= 30
+    c.setFont("Helvetica", 12)
+    if not t["alunos"]:
+        c.drawString(50, y, "Sem alunos matriculados.")
+    else:
+        for aid in t["alunos"]:
+            a = buscar_aluno_por_id(aid)
+            if not a:
+                continue
+            c.drawString(50, y, f"{a['matricula']} - {a['nome']}")
+            y -= 20
+            for atv_id in t.get("atividades", []):
+                atv = buscar_atividade_por_id(atv_id)
+                if atv and str(aid) in atv.get("notas", {}):
+                    c.drawString(70, y, f"{atv['nome']}: {atv['notas'][str(aid)]}")
+                    y -= 18
+            y -= 8
+            if y < 70:
+                c.showPage()
+                c.setFont("Helvetica", 12)
+                y = height - 40
+    c.save()
+    print(f"✅ PDF de turma gerado: {filename}")
+
+# =========== BOLETINS POR ALUNO (NOVO) ===========
+def gerar_boletins_pdf(corte_aprovacao=CORTE_APROVACAO):
+    if not alunos:
+        print("Não há alunos cadastrados.")
+        return
+    rl = _reportlab()
+    if not rl: return
+    letter, canvas, cm = rl
+
+    # cria pasta para boletins
+    pasta = "boletins_alunos"
+    os.makedirs(pasta, exist_ok=True)
+
+    for aluno in alunos:
+        filename = os.path.join(pasta, f"boletim_{aluno['matricula']}_{aluno['id']}.pdf")
+        c = canvas.Canvas(filename, pagesize=letter)
+        width, height = letter
+        margem_x = 2*cm
+        y = height - 2*cm
+
+        # cabeçalho
+        c.setFont("Helvetica-Bold", 16)
+        c.drawString(margem_x, y, "Boletim Escolar")
+        c.setFont("Helvetica", 10)
+        c.drawString(width - margem_x - 200, y, f"Aluno: {aluno['nome']}")
+        y -= 18
+        c.drawString(margem_x, y, f"Matrícula: {aluno['matricula']}  |  ID: {aluno['id']}")
+        y -= 24
+        c.line(margem_x, y, width - margem_x, y)
+        y -= 14
+
+        medias_turmas = []
+        # percorre turmas do aluno
+        turmas_do_aluno = [t for t in turmas if aluno['id'] in t['alunos']]
+        if not turmas_do_aluno:
+            c.drawString(margem_x, y, "Aluno não está matriculado em nenhuma turma.")
+            y -= 18
+        else:
+            for t in turmas_do_aluno:
+                c.setFont("Helvetica-Bold", 12)
+                c.drawString(margem_x, y, f"Turma: {t['nome']}")
+                y -= 16
+                c.setFont("Helvetica", 10)
+
+                # cabeçalho da tabela simples
+                c.drawString(margem_x, y, "Atividade")
+                c.drawString(margem_x + 8*cm, y, "Descrição")
+                c.drawString(margem_x + 14*cm, y, "Nota")
+                y -= 12
+                c.line(margem_x, y, width - margem_x, y)
+                y -= 8
+
+                notas_turma = []
+                ativs = [atv for atv in map(buscar_atividade_por_id, t.get("atividades", [])) if atv]
+                if not ativs:
+                    c.drawString(margem_x, y, "Nenhuma atividade cadastrada nesta turma.")
+                    y -= 18
+                else:
+                    for atv in ativs:
+                        nome = atv['nome']
+                        descr = atv.get('descricao', '')
+                        nota = atv.get("notas", {}).get(str(aluno['id']), "—")
+                        nota_text = f"{nota}" if nota != "—" else "—"
+                        if nota != "—":
+                            try:
+                                notas_turma.append(float(nota))
+                            except:
+                                pass
+                        # escreve linha
+                        c.drawString(margem_x, y, nome[:30])
+                        c.drawString(margem_x + 8*cm, y, (descr[:55] if descr else ""))
+                        c.drawString(margem_x + 14*cm, y, nota_text)
+                        y -= 14
+                        if y < 80:
+                            c.showPage()
+                            y = height - 2*cm
+                    # média da turma para o aluno
+                    media_t = sum(notas_turma)/len(notas_turma) if notas_turma else None
+                    if media_t is not None:
+                        medias_turmas.append(media_t)
+                        c.setFont("Helvetica-Bold", 10)
+                        c.drawString(margem_x, y, f"Média da turma {t['nome']}: {media_t:.2f}")
+                        c.setFont("Helvetica", 10)
+                        y -= 16
+                    else:
+                        c.drawString(margem_x, y, "Média da turma: — (sem notas)")
+                        y -= 16
+
+                y -= 6
+                if y < 80:
+                    c.showPage()
+                    y = height - 2*cm
+
+        # média geral do aluno (média das médias por turma)
+        if medias_turmas:
+            media_geral = sum(medias_turmas)/len(medias_turmas)
+            situacao = "APROVADO" if media_geral >= corte_aprovacao else "REPROVADO"
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(margem_x, y, f"Média geral: {media_geral:.2f}   |   Situação: {situacao}")
+        else:
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(margem_x, y, "Média geral: —   |   Situação: — (sem notas)")
+
+        c.save()
+        print(f"✅ Boletim gerado: {filename}")
+
+# =========== RELATÓRIO INTELIGENTE / AUXILIARES ===========
+def gerar_relatorio_inteligente():
+    print("\n=== Relatório Inteligente ===")
+    for t in turmas:
+        notas_turma = []
+        for atv_id in t.get("atividades", []):
+            atv = buscar_atividade_por_id(atv_id)
+            if atv:
+                for v in atv.get("notas", {}).values():
+                    notas_turma.append(v)
+        media = math.fsum(notas_turma)/len(notas_turma) if notas_turma else 0
+        print(f"Turma {t['nome']} - Média: {media:.2f} -> {analise_media(media)}")
+
+def analise_media(media):
+    if media >= 8.5:
+        return "Excelente desempenho"
+    elif media >= 7:
+        return "Bom desempenho"
+    elif media >= 5:
+        return "Desempenho mediano"
+    return "Desempenho abaixo do esperado"
+
+def melhor_pior_aluno_turma():
+    listar_turmas()
+    if not turmas: return
+    tid = input_int("ID da turma (0 cancelar): ", min_val=0)
+    if tid == 0: return
+    t = buscar_turma_por_id(tid)
+    if not t:
+        print("Turma não encontrada.")
+        return
+    r = rankings()["turma"].get(tid)
+    if not r:
+        print("Nenhum aluno com notas nesta turma.")
+        return
+    (id_melhor, media_melhor), = r.topo(1)
+    (id_pior, media_pior), = r.base(1)
+    for rotulo, aid, media in (("Melhor", id_melhor, media_melhor), ("Pior", id_pior, media_pior)):
+        # a turma pode listar um aluno já removido (ver integridade)
+        a = buscar_aluno_por_id(aid)
+        nome = a["nome"] if a else f"Aluno {aid}"
+        print(f"{rotulo}: {nome} - Média: {media:.2f}")
+
+def _mostrar_ranking(titulo, r, k):
+    def formatar(item):
+        pos, (aid, valor) = item
+        a = buscar_aluno_por_id(aid)
+        nome = f"{a['matricula']} - {a['nome']}" if a else f"Aluno {aid}"
+        return f"{pos:>4}º  {nome} - {valor:.2f} (percentil {r.percentil(aid):.0f})"
+    print(f"\n{titulo}: {len(r)} aluno(s) com notas")
+    topo = r.topo(k)
+    paginar(f"{k} MELHORES", list(enumerate(topo, start=1)), formatar,
+            chave=lambda item: item[1][0], vazio="Ninguém com notas.")
+    base = r.base(k)
+    paginar(f"{k} PIORES", [(len(r) - i, par) for i, par in enumerate(base)], formatar,
+            chave=lambda item: item[1][0], vazio="Ninguém com notas.")
+
+def rankings_ui():
+    print("\n1. Ranking de uma turma")
+    print("2. Ranking de uma atividade")
+    print("3. Ranking da escola (média geral)")
+    print("4. Percentis de um aluno")
+    op = input("Escolha: ").strip()
+    rk = rankings()
+    if op in ("1", "2", "3"):
+        k = input_int("Quantos alunos mostrar no topo e na base? (Enter = 10): ", min_val=1, allow_empty=True) or 10
+    if op == "1":
+        listar_turmas()
+        tid = input_int("ID da turma (0 cancelar): ", min_val=0)
+        if tid == 0: return
+        t = buscar_turma_por_id(tid)
+        if not t:
+            print("Turma não encontrada.")
+            return
+        _mostrar_ranking(f"Turma {t['nome']}", rk["turma"].get(tid, Ranking()), k)
+    elif op == "2":
+        atv = escolher_atividade()
+        if not atv: return
+        _mostrar_ranking(f"Atividade {atv['nome']}", rk["atividade"].get(atv["id"], Ranking()), k)
+    elif op == "3":
+        _mostrar_ranking("Escola", rk["escola"], k)
+    elif op == "4":
+        aid = input_int("ID do aluno (0 cancelar): ", min_val=0)
+        if aid == 0: return
+        a = buscar_aluno_por_id(aid)
+        if not a:
+            print("Aluno não encontrado.")
+            return
+        if aid not in rk["escola"]:
+            print("Aluno sem notas.")
+            return
+        print(f"{a['nome']} - média geral {rk['escola'].valor(aid):.2f}, percentil na escola: {rk['escola'].percentil(aid):.1f}")
+        for tid, media in rk["medias"].get(aid, {}).items():
+            t = buscar_turma_por_id(tid)
+            print(f"  Turma {t['nome'] if t else tid}: média {media:.2f}, percentil {rk['turma'][tid].percentil(aid):.1f}")
+    else:
+        print("Opção inválida.")
+
+# =========== ALUNOS EM RISCO (CONSULTA POR ÍNDICES) ===========
+ARQ_EM_RISCO = "alunos_em_risco.csv"
+
+def consultar_em_risco(media_abaixo=None, faltantes_acima=None, turma=None, atividade=None, nota_abaixo=None):
+    # filtros combinados com E; cada um é respondido pelos rankings (bisect), sem varrer as notas
+    rk = rankings()
+    atv = None
+    if atividade is not None:
+        atv = buscar_atividade_por_id(atividade)
+        if not atv or (turma is not None and turma != atv["turma_id"]):
+            return []
+        turma = atv["turma_id"]
+    alvo = [buscar_turma_por_id(turma)] if turma is not None else turmas
+    resultado = []
+    for t in alvo:
+        if not t:
+            continue
+        filtros = []
+        if media_abaixo is not None:
+            filtros.append({aid for aid, _ in rk["turma"].get(t["id"], Ranking()).abaixo_de(media_abaixo)})
+        if faltantes_acima is not None:
+            filtros.append({aid for aid, _ in rk["faltantes"].get(t["id"], Ranking()).acima_de(faltantes_acima)})
+        r_atv = rk["atividade"].get(atv["id"], Ranking()) if atv else None
+        if atv:
+            # sem nota na atividade, ou com nota abaixo do limite
+            ids = {aid for aid in t["alunos"] if aid not in r_atv}
+            if nota_abaixo is not None:
+                ids.update(aid for aid, _ in r_atv.abaixo_de(nota_abaixo))
+            filtros.append(ids)
+        ids = set(t["alunos"]).intersection(*filtros)
+        for aid in sorted(ids):
+            resultado.append({"aluno_id": aid, "turma_id": t["id"],
+                              "media": rk["turma"].get(t["id"], Ranking()).valor(aid),
+                              "faltantes": rk["faltantes"].get(t["id"], Ranking()).valor(aid),
+                              "nota_atividade": r_atv.valor(aid) if atv else None})
+    return resultado
+
+def formatar_em_risco(r):
+    a = buscar_aluno_por_id(r["aluno_id"])
+    t = buscar_turma_por_id(r["turma_id"])
+    media = f"{r['media']:.2f}" if r["media"] is not None else "sem notas"
+    texto = (f"{a['matricula'] if a else '?'} - {a['nome'] if a else r['aluno_id']} | "
+             f"Turma: {t['nome'] if t else r['turma_id']} | média {media} | {r['faltantes']} sem nota")
+    if r["nota_atividade"] is not None:
+        texto += f" | nota na atividade {r['nota_atividade']}"
+    return texto
+
+def exportar_em_risco(resultado, caminho=ARQ_EM_RISCO):
+    # ";" para abrir direto no Excel em português
+    linhas = ["aluno_id;matricula;nome;turma_id;turma;media;faltantes;nota_atividade"]
+    for r in resultado:
+        a = buscar_aluno_por_id(r["aluno_id"]) or {}
+        t = buscar_turma_por_id(r["turma_id"]) or {}
+        media = f"{r['media']:.2f}".replace(".", ",") if r["media"] is not None else ""
+        nota = str(r["nota_atividade"]).replace(".", ",") if r["nota_atividade"] is not None else ""
+        linhas.append(";".join([str(r["aluno_id"]), a.get("matricula", ""), a.get("nome", ""),
+                                str(r["turma_id"]), t.get("nome", ""), media, str(r["faltantes"]), nota]))
+    with open(caminho, "w", encoding="utf-8-sig") as f:
+        f.write("\n".join(linhas) + "\n")
+    return len(resultado)
+
+def alunos_em_risco_ui():
+    print("\nFiltros (Enter = ignorar)")
+    media = input_float(f"Média na turma abaixo de (Enter = {CORTE_APROVACAO}, 0 = ignorar): ",
+                        min_val=0, max_val=10, allow_empty=True)
+    media = CORTE_APROVACAO if media is None else (media or None)
+    faltantes = input_int("Mais de quantas atividades sem nota: ", min_val=0, allow_empty=True)
+    tid = input_int("ID da turma: ", min_val=1, allow_empty=True)
+    aid = input_int("ID da atividade (sem nota ou nota baixa nela): ", min_val=1, allow_empty=True)
+    nota = input_float("Nota na atividade abaixo de: ", min_val=0, max_val=10, allow_empty=True) if aid else None
+    resultado = consultar_em_risco(media, faltantes, tid, aid, nota)
+    paginar("ALUNOS EM RISCO", resultado, formatar_em_risco,
+            chave=lambda r: r["aluno_id"], vazio="Nenhum aluno atende aos filtros.")
+    if resultado and confirma(f"Exportar lista para {ARQ_EM_RISCO}? (s/n): "):
+        exportar_em_risco(resultado)
+        print(f"✅ {len(resultado)} alunos exportados para {ARQ_EM_RISCO}.")
+
+# =========== NOTAS EM COLUNAS (MMAP, SOMENTE LEITURA) ===========
+# notas.col guarda todas as notas em arrays de largura fixa, ordenadas por
+# (turma, aluno, atividade), mais um índice por aluno (permutação) e diretórios
+# de turmas e alunos. Processos de relatório abrem o arquivo com mmap e leem as
+# colunas como memoryview: sem cópia, sem parse e com o cache de páginas do
+# sistema compartilhado entre todos os processos.
+#
+#   cabeçalho | nota d[n] | turma i[n] | aluno i[n] | atividade i[n] | perm_aluno i[n]
+#   | turma_ids i[nt] | turma_inicio i[nt+1] | aluno_ids i[na] | aluno_inicio i[na+1]
+MAGIC_COL = b"PIMC"
+VERSAO_COL = 1
+_CAB_COL = struct.Struct("<4sBBxxIIId4x")  # magic, versão, ordem dos bytes, n, nt, na, gerado_em
+
+def _arquivo_colunar():
+    return os.path.join(PASTA_DADOS, armazenamento._periodo, ARQ_COLUNAR) if armazenamento._periodo else ARQ_COLUNAR
+
+def _diretorio(valores, n):
+    # valores já ordenados -> (ids distintos, início de cada id + n no fim)
+    ids, inicio = array("i"), array("i")
+    anterior = None
+    for i, v in enumerate(valores):
+        if v != anterior:
+            ids.append(v)
+            inicio.append(i)
+            anterior = v
+    inicio.append(n)
+    return ids, inicio
+
+def exportar_notas_colunar(caminho=None):
+    caminho = caminho or _arquivo_colunar()
+    abrir_periodo()
+    # as colunas seguem a lista de atividades de cada turma, como o relatório e os rankings
+    linhas = sorted((t["id"], int(sid), atv["id"], float(nota))
+                    for t in turmas for atv in map(buscar_atividade_por_id, t.get("atividades", [])) if atv
+                    for sid, nota in atv.get("notas", {}).items()
+                    if sid.isdigit() and isinstance(nota, (int, float)) and not isinstance(nota, bool))
+    n = len(linhas)
+    nota = array("d", (x[3] for x in linhas))
+    turma = array("i", (x[0] for x in linhas))
+    aluno = array("i", (x[1] for x in linhas))
+    atividade = array("i", (x[2] for x in linhas))
+    perm = array("i", sorted(range(n), key=lambda i: (aluno[i], turma[i], atividade[i])))
+    turma_ids, turma_inicio = _diretorio(turma, n)
+    aluno_ids, aluno_inicio = _diretorio((aluno[p] for p in perm), n)
+    cab = _CAB_COL.pack(MAGIC_COL, VERSAO_COL, 0 if sys.byteorder == "little" else 1,
+                        n, len(turma_ids), len(aluno_ids), time.time())
+    # grava ao lado e troca: quem já mapeou o arquivo antigo continua lendo a versão antiga
+    with open(caminho + ".tmp", "wb") as f:
+        f.write(cab)
+        for coluna in (nota, turma, aluno, atividade, perm, turma_ids, turma_inicio, aluno_ids, aluno_inicio):
+            coluna.tofile(f)
+    os.replace(caminho + ".tmp", caminho)
+    return n
+
+class NotasColunares:
+    def __init__(self, caminho=None):
+        caminho = caminho or _arquivo_colunar()
+        with open(caminho, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < _CAB_COL.size:
+            self._mm.close()
+            raise ValueError(f"{caminho}: arquivo truncado")
+        magic, versao, ordem, n, nt, na, self.gerado_em = _CAB_COL.unpack_from(self._mm)
+        tamanho = _CAB_COL.size + 8 * n + 4 * (4 * n + 2 * nt + 2 * na + 2)
+        erro = None
+        if magic != MAGIC_COL:
+            erro = "não é um arquivo de notas em colunas"
+        elif versao > VERSAO_COL:
+            erro = f"versão {versao} é mais nova que este programa"
+        elif ordem != (0 if sys.byteorder == "little" else 1):
+            erro = "gerado em máquina com outra ordem de bytes; exporte de novo"
+        elif len(self._mm) != tamanho:
+            erro = "tamanho não confere (truncado ou corrompido)"
+        if erro:
+            self._mm.close()
+            raise ValueError(f"{caminho}: {erro}")
+        self._mv = memoryview(self._mm)
+        self._colunas = []
+        pos = _CAB_COL.size
+        def coluna(fmt, qtd):
+            nonlocal pos
+            tam = qtd * struct.calcsize(fmt)
+            c = self._mv[pos:pos + tam].cast(fmt)
+            self._colunas.append(c)
+            pos += tam
+            return c
+        self.nota = coluna("d", n)
+        self.turma = coluna("i", n)
+        self.aluno = coluna("i", n)
+        self.atividade = coluna("i", n)
+        self._perm = coluna("i", n)
+        self._turma_ids = coluna("i", nt)
+        self._turma_inicio = coluna("i", nt + 1)
+        self._aluno_ids = coluna("i", na)
+        self._aluno_inicio = coluna("i", na + 1)
+
+    def __len__(self):
+        return len(self.nota)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def fechar(self):
+        for c in self._colunas:
+            c.release()
+        self._mv.release()
+        self._mm.close()
+
+    @staticmethod
+    def _faixa(ids, inicio, chave):
+        i = bisect.bisect_left(ids, chave)
+        if i < len(ids) and ids[i] == chave:
+            return inicio[i], inicio[i + 1]
+        return 0, 0
+
+    def turmas(self):
+        return self._turma_ids.tolist()
+
+    def notas_da_turma(self, tid):
+        # (aluno, atividade, nota) ordenado por aluno
+        a, b = self._faixa(self._turma_ids, self._turma_inicio, tid)
+        return zip(self.aluno[a:b], self.atividade[a:b], self.nota[a:b])
+
+    def notas_do_aluno(self, aid):
+        # (turma, atividade, nota) ordenado por turma
+        a, b = self._faixa(self._aluno_ids, self._aluno_inicio, aid)
+        return [(self.turma[p], self.atividade[p], self.nota[p]) for p in self._perm[a:b]]
+
+    def media_turma(self, tid):
+        a, b = self._faixa(self._turma_ids, self._turma_inicio, tid)
+        return math.fsum(self.nota[a:b]) / (b - a) if b > a else None
+
+    def media_aluno_na_turma(self, tid, aid):
+        a, b = self._faixa(self._turma_ids, self._turma_inicio, tid)
+        ini = bisect.bisect_left(self.aluno, aid, a, b)
+        fim = bisect.bisect_right(self.aluno, aid, ini, b)
+        return math.fsum(self.nota[ini:fim]) / (fim - ini) if fim > ini else None
+
+def relatorio_inteligente_colunar(caminho=None):
+    # mesmo resultado de gerar_relatorio_inteligente: a exportação agrupa pela lista de
+    # atividades de cada turma e ambos somam com fsum, que não depende da ordem das notas
+    localizar_dados()
+    turmas_arq = _ler_disco(armazenamento.ARQ_TURM) or []
+    with NotasColunares(caminho) as col:
+        gerado = time.strftime("%d/%m/%Y %H:%M", time.localtime(col.gerado_em))
+        print(f"\n=== Relatório Inteligente (notas de {gerado}) ===")
+        for t in turmas_arq:
+            media = col.media_turma(t["id"]) or 0
+            print(f"Turma {t['nome']} - Média: {media:.2f} -> {analise_media(media)}")
+
+def exportar_notas_colunar_ui():
+    n = exportar_notas_colunar()
+    print(f"✅ {n} notas exportadas para {_arquivo_colunar()}.")
@@ -0,0 +1,93 @@
+# escola/utilitarios.py - leitura de opções do teclado, senha e listagem paginada
+import hashlib
+import sys
+
+# =========== ENTRADA DE DADOS ===========
+def hash_senha(senha):
+    return hashlib.sha256(senha.encode()).hexdigest()
+
+def input_int(prompt, min_val=None, max_val=None, allow_empty=False):
+    while True:
+        v = input(prompt).strip()
+        if allow_empty and v == "":
+            return None
+        if not v.isdigit():
+            print("Digite um número válido.")
+            continue
+        n = int(v)
+        if min_val is not None and n < min_val:
+            print(f"Valor mínimo: {min_val}")
+            continue
+        if max_val is not None and n > max_val:
+            print(f"Valor máximo: {max_val}")
+            continue
+        return n
+
+def input_float(prompt, min_val=None, max_val=None, allow_empty=False):
+    while True:
+        v = input(prompt).strip()
+        if allow_empty and v == "":
+            return None
+        try:
+            f = float(v.replace(",", "."))
+        except:
+            print("Digite um número válido (use . ou ,).")
+            continue
+        if min_val is not None and f < min_val:
+            print(f"Valor mínimo: {min_val}")
+            continue
+        if max_val is not None and f > max_val:
+            print(f"Valor máximo: {max_val}")
+            continue
+        return f
+
+def confirma(prompt="Confirmar? (s/n): "):
+    r = input(prompt).strip().lower()
+    return r in ("s", "y")
+
+# =========== LISTAGEM PAGINADA ===========
+TAM_PAGINA = 20
+
+def paginar(titulo, itens, formatar, chave=lambda x: x["id"], vazio="Nenhum registro."):
+    print(f"\n=== {titulo} ===")
+    if not itens:
+        print(vazio)
+        return
+    visiveis = itens
+    filtro = ""
+    pagina = 0
+    posicoes = None
+    while True:
+        total_pag = max(1, -(-len(visiveis) // TAM_PAGINA))
+        pagina = max(0, min(pagina, total_pag - 1))
+        ini = pagina * TAM_PAGINA
+        linhas = [formatar(x) for x in visiveis[ini:ini + TAM_PAGINA]] or ["Nenhum registro para o filtro."]
+        if total_pag == 1 and not filtro:
+            sys.stdout.write("\n".join(linhas) + "\n")
+            return
+        info_filtro = f", filtro: '{filtro}'" if filtro else ""
+        sys.stdout.write("\n".join(linhas) + f"\n-- página {pagina + 1}/{total_pag} ({len(visiveis)} registros{info_filtro}) --\n")
+        cmd = input("[Enter] próxima  [a] anterior  [/texto] filtrar  [#id] ir para ID  [q] sair: ").strip()
+        if cmd == "":
+            if pagina == total_pag - 1:
+                return
+            pagina += 1
+        elif cmd.lower() == "a":
+            pagina -= 1
+        elif cmd.lower() == "q":
+            return
+        elif cmd.startswith("/"):
+            filtro = cmd[1:].strip().lower()
+            visiveis = [x for x in itens if filtro in formatar(x).lower()] if filtro else itens
+            pagina = 0
+            posicoes = None
+        elif cmd.startswith("#") and cmd[1:].isdigit():
+            if posicoes is None:
+                posicoes = {chave(x): i for i, x in enumerate(visiveis)}
+            pos = posicoes.get(int(cmd[1:]))
+            if pos is None:
+                print("ID não encontrado na listagem.")
+            else:
+                pagina = pos // TAM_PAGINA
+        else:
+            print("Opção inválida.")
@@ -0,0 +1,200 @@
+# Mescla entre terminais: esta sessão roda no processo do teste e o "outro
+# terminal" é um segundo processo que carrega, altera e grava nos mesmos arquivos.
+# Rodar de dentro de "PIM SEM A INTEGRAÇÃO": python -m unittest discover tests
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+PASTA = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PASTA)
+
+from escola import armazenamento as A
+
+def gravar(nome, dados):
+    with open(nome, "w", encoding="utf-8") as f:
+        json.dump(dados, f)
+
+def ler(nome):
+    with open(nome, encoding="utf-8") as f:
+        return {r["id"]: r for r in json.load(f)}
+
+class MesclaEntreTerminais(unittest.TestCase):
+    def setUp(self):
+        self.antes = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        gravar("professores.json", [])
+        gravar("alunos.json", [{"id": i, "nome": f"Aluno {i}", "matricula": f"M{i}", "_versao": 1}
+                               for i in (1, 2)])
+        gravar("turmas.json", [{"id": 1, "nome": "T1", "alunos": [1, 2], "atividades": [1], "_versao": 1},
+                               {"id": 2, "nome": "T2", "alunos": [], "atividades": [], "_versao": 1}])
+        gravar("atividades.json", [{"id": 1, "nome": "P1", "turma_id": 1, "notas": {}, "_versao": 1}])
+        A._base.clear()
+        A._assinaturas.clear()
+        A._periodo = None
+        A.ARQ_PROF, A.ARQ_ALUN, A.ARQ_TURM = "professores.json", "alunos.json", "turmas.json"
+        A.carregar_tudo()
+
+    def tearDown(self):
+        os.chdir(self.antes)
+        self.tmp.cleanup()
+
+    def outro_terminal(self, codigo):
+        prog = "from escola import armazenamento as A\nA.carregar_tudo()\n" + textwrap.dedent(codigo) + "\nA.salvar_tudo()\n"
+        subprocess.run([sys.executable, "-c", prog], check=True, capture_output=True,
+                       env=dict(os.environ, PYTHONPATH=PASTA))
+
+    def salvar(self):
+        saida = io.StringIO()
+        with redirect_stdout(saida):
+            A.salvar_tudo()
+        return saida.getvalue()
+
+    def test_notas_de_alunos_diferentes(self):
+        self.outro_terminal('A.atividades[0]["notas"]["2"] = 8.0')
+        A.atividades[0]["notas"]["1"] = 5.0
+        self.assertEqual(self.salvar(), "")
+        self.assertEqual(ler("atividades.json")[1]["notas"], {"1": 5.0, "2": 8.0})
+        self.assertEqual(A.atividades[0]["notas"], {"1": 5.0, "2": 8.0})
+
+    def test_mesmo_campo_fica_o_do_outro_terminal(self):
+        self.outro_terminal('A.alunos[0]["nome"] = "Nome B"')
+        A.alunos[0]["nome"] = "Nome A"
+        A.alunos[0]["matricula"] = "M1-A"
+        saida = self.salvar()
+        self.assertIn("Conflito", saida)
+        gravado = ler("alunos.json")[1]
+        self.assertEqual((gravado["nome"], gravado["matricula"]), ("Nome B", "M1-A"))
+
+    def test_cadastros_simultaneos_recebem_ids_diferentes(self):
+        self.outro_terminal('''
+            aid = A.prox_id(A.atividades)
+            A.atividades.append({"id": aid, "nome": "de B", "turma_id": 2, "notas": {}})
+            A.turmas[1]["atividades"].append(aid)
+        ''')
+        aid = A.prox_id(A.atividades)
+        A.atividades.append({"id": aid, "nome": "de A", "turma_id": 1, "notas": {}})
+        A.turmas[0]["atividades"].append(aid)
+        self.assertNotIn("já usado", self.salvar())
+        ativs, turmas = ler("atividades.json"), ler("turmas.json")
+        self.assertEqual({a["nome"]: a["turma_id"] for a in ativs.values()}, {"P1": 1, "de B": 2, "de A": 1})
+        for t in turmas.values():
+            self.assertTrue(all(ativs[x]["turma_id"] == t["id"] for x in t["atividades"]))
+
+    def test_renumeracao_nao_mexe_nas_referencias_do_outro(self):
+        # script de importação que grava sem reservar id
+        self.outro_terminal('''
+            A.alunos.append({"id": 3, "nome": "Importado", "matricula": "M3"})
+            A.turmas[1]["alunos"].append(3)
+            A.atividades[0]["notas"]["3"] = 9.0
+        ''')
+        aid = A.prox_id(A.alunos)
+        A.alunos.append({"id": aid, "nome": "Novo", "matricula": "M9"})
+        A.turmas[0]["alunos"].append(aid)
+        A.atividades[0]["notas"][str(aid)] = 4.0
+        self.assertIn("já usado", self.salvar())
+        alunos, turmas = ler("alunos.json"), ler("turmas.json")
+        novo = next(a["id"] for a in alunos.values() if a["nome"] == "Novo")
+        self.assertEqual(alunos[3]["nome"], "Importado")
+        self.assertEqual(turmas[2]["alunos"], [3])
+        self.assertEqual(turmas[1]["alunos"], [1, 2, novo])
+        self.assertEqual(ler("atividades.json")[1]["notas"], {"3": 9.0, str(novo): 4.0})
+
+    def test_removido_aqui_e_alterado_no_outro(self):
+        self.outro_terminal('A.alunos[1]["nome"] = "Alterado em B"')
+        A.alunos.pop(1)
+        saida = self.salvar()
+        self.assertIn("removido aqui", saida)
+        self.assertEqual(ler("alunos.json")[2]["nome"], "Alterado em B")
+        self.assertEqual([a["id"] for a in A.alunos], [1, 2])
+
+    def test_alterado_aqui_e_removido_no_outro(self):
+        self.outro_terminal('A.alunos.pop(1)')
+        A.alunos[1]["nome"] = "Alterado em A"
+        self.assertIn("removido por outro terminal", self.salvar())
+        self.assertNotIn(2, ler("alunos.json"))
+
+    def test_remocao_sem_conflito(self):
+        self.outro_terminal('A.alunos[0]["nome"] = "Outro"')
+        A.alunos.pop(1)
+        self.assertEqual(self.salvar(), "")
+        self.assertEqual(sorted(ler("alunos.json")), [1])
+
+    def test_script_que_nao_incrementa_a_versao(self):
+        # importação que grava direto no JSON, sem mexer em _versao
+        disco = ler("alunos.json")
+        disco[1]["nome"] = "Nome do script"
+        gravar("alunos.json", list(disco.values()))
+        A.alunos[0]["matricula"] = "M1-A"
+        self.assertEqual(self.salvar(), "")
+        gravado = ler("alunos.json")[1]
+        self.assertEqual((gravado["nome"], gravado["matricula"]), ("Nome do script", "M1-A"))
+
+    def test_regravacao_do_mesmo_tamanho_no_mesmo_mtime(self):
+        # sistema de arquivos com mtime grosseiro: conteúdo novo, mesmo tamanho e mesmo mtime
+        st = os.stat("alunos.json")
+        with open("alunos.json", encoding="utf-8") as f:
+            texto = f.read()
+        with open("alunos.json", "w", encoding="utf-8") as f:
+            f.write(texto.replace("Aluno 2", "Aluno X"))
+        os.utime("alunos.json", ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertEqual(os.stat("alunos.json").st_size, st.st_size)
+        self.assertTrue(A._arquivo_alterado("alunos.json"))
+        A.alunos[0]["nome"] = "Local"
+        self.salvar()
+        self.assertEqual([a["nome"] for a in ler("alunos.json").values()], ["Local", "Aluno X"])
+
+    def responder(self, funcao, *respostas):
+        with mock.patch("builtins.input", side_effect=respostas), redirect_stdout(io.StringIO()):
+            funcao()
+
+    def test_periodo_encerrado_por_outro_terminal(self):
+        self.responder(A.organizar_por_periodo, "2025-1", "s")
+        A.abrir_turma(1)
+        self.outro_terminal('''
+            import builtins
+            respostas = iter(["2025-2", "s", "s"])
+            builtins.input = lambda texto="": next(respostas)
+            A.encerrar_periodo()
+        ''')
+        A.prox_id(A.alunos)   # a reserva grava o manifesto e não pode esconder a mudança
+        A.atividades[0]["notas"]["1"] = 5.0
+        A.turmas[0]["nome"] = "Renomeada"
+        self.assertIn("NÃO foi gravada", self.salvar())
+        self.assertEqual(A._periodo, "2025-2")
+        self.assertEqual(ler("dados/2025-1/turma_1.json")[1]["notas"], {})
+        self.assertEqual(ler("dados/2025-1/turmas.json")[1]["nome"], "T1")
+
+    def test_dados_organizados_por_outro_terminal(self):
+        self.outro_terminal('''
+            import builtins
+            respostas = iter(["2025-1", "s"])
+            builtins.input = lambda texto="": next(respostas)
+            A.organizar_por_periodo()
+        ''')
+        A.atividades[0]["notas"]["1"] = 5.0
+        self.assertIn("NÃO foi gravada", self.salvar())
+        self.assertEqual(A._periodo, "2025-1")
+        self.assertEqual(ler("atividades.json")[1]["notas"], {})
+
+    def test_mudanca_de_periodo_entre_menus(self):
+        self.responder(A.organizar_por_periodo, "2025-1", "s")
+        self.outro_terminal('''
+            import builtins
+            respostas = iter(["2025-2", "n", "s"])
+            builtins.input = lambda texto="": next(respostas)
+            A.encerrar_periodo()
+        ''')
+        with redirect_stdout(io.StringIO()):
+            self.assertTrue(A.recarregar_alteracoes())
+        self.assertEqual((A._periodo, A.turmas), ("2025-2", []))
+
+if __name__ == "__main__":
+    unittest.main()
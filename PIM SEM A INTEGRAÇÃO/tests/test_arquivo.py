@@ -0,0 +1,64 @@
+# Snapshots do arquivo: restaurar um aluno só abre os baldes de que precisa.
+# Rodar de dentro de "PIM SEM A INTEGRAÇÃO": python -m unittest discover tests
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from escola import armazenamento as A
+from escola import arquivo
+
+def gravar(nome, dados):
+    with open(nome, "w", encoding="utf-8") as f:
+        json.dump(dados, f)
+
+class RestaurarAluno(unittest.TestCase):
+    def setUp(self):
+        self.antes = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        gravar("professores.json", [])
+        gravar("alunos.json", [{"id": i, "nome": f"Aluno {i}", "matricula": f"M{i}"} for i in (1, 2)])
+        gravar("turmas.json", [{"id": t, "nome": f"T{t}", "alunos": [1, 2] if t != 2 else [2], "atividades": [t]}
+                               for t in (1, 2, 3)])
+        gravar("atividades.json", [{"id": t, "nome": f"P{t}", "turma_id": t, "notas": {"1": 7.0, "2": 5.0}}
+                                   for t in (1, 2, 3)])
+        A._base.clear()
+        A._assinaturas.clear()
+        A._periodo = None
+        A.ARQ_PROF, A.ARQ_ALUN, A.ARQ_TURM = "professores.json", "alunos.json", "turmas.json"
+        A.carregar_tudo()
+        # um registro por balde: cada turma fica num objeto separado
+        self.balde = mock.patch.object(arquivo, "TAM_BALDE", 1)
+        self.balde.start()
+        arquivo.arquivar("antes")
+
+    def tearDown(self):
+        self.balde.stop()
+        os.chdir(self.antes)
+        self.tmp.cleanup()
+
+    def test_restaura_matriculas_e_notas_lendo_so_as_turmas_do_aluno(self):
+        A.turmas[0]["alunos"].remove(1)
+        for atv in A.atividades:
+            atv["notas"].pop("1")
+        with redirect_stdout(io.StringIO()):
+            A.salvar_tudo()
+        snap = arquivo._ler_snapshot("antes")
+        outra = snap["colecoes"]["turmas"]["baldes"]["2"]
+        with mock.patch.object(arquivo, "_ler_objeto", wraps=arquivo._ler_objeto) as ler:
+            r = arquivo.restaurar_aluno("antes", 1)
+        lidos = [c.args[0] for c in ler.call_args_list]
+        self.assertNotIn(outra, lidos)
+        self.assertEqual(r, {"matriculas": 1, "notas": 2})
+        self.assertEqual([t["alunos"] for t in A.turmas], [[2, 1], [2], [1, 2]])
+        self.assertEqual([a["notas"].get("1") for a in A.atividades], [7.0, None, 7.0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+# Leitura da planilha de notas colada ou importada (lançamento em lote).
+# Rodar de dentro de "PIM SEM A INTEGRAÇÃO": python -m unittest discover tests
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from escola import armazenamento as A
+from escola.dominio import _interpretar_planilha
+
+class Planilha(unittest.TestCase):
+    def setUp(self):
+        A.alunos[:] = [{"id": i, "nome": f"Aluno {i}", "matricula": f"A202400{i}"} for i in (1, 2, 3)]
+        A.invalidar_indices()
+        self.turma = {"id": 1, "nome": "T1", "alunos": [1, 2, 3], "atividades": []}
+
+    def ler(self, *linhas):
+        return _interpretar_planilha(list(linhas), self.turma)
+
+    def test_separadores(self):
+        esperado = ({"1": 7.0, "2": 8.5, "3": None}, [])
+        self.assertEqual(self.ler("A2024001;7", "A2024002;8,5", "A2024003;-"), esperado)
+        self.assertEqual(self.ler("1\t7", "2\t8.5", "3\t-"), esperado)
+        self.assertEqual(self.ler("1 7", "A2024002 8,5", "3 -"), esperado)
+
+    def test_cabecalho(self):
+        self.assertEqual(self.ler("Matrícula;Nota", "A2024001;7", "A2024002;8"), ({"1": 7.0, "2": 8.0}, []))
+
+    def test_primeira_linha_com_nota_nao_e_cabecalho(self):
+        lote, erros = self.ler("A2024009;7", "A2024002;8")
+        self.assertEqual(lote, {"2": 8.0})
+        self.assertEqual(erros, ["Linha 1: aluno 'A2024009' não pertence à turma."])
+
+    def test_numeracao_das_linhas_com_cabecalho(self):
+        _, erros = self.ler("ID;Nota", "1;7", "2;11")
+        self.assertEqual(erros, ["Linha 3: nota '11' inválida (0-10)."])
+
+    def test_uma_coluna(self):
+        self.assertEqual(self.ler("7", "8,5", "-"), ({"1": 7.0, "2": 8.5, "3": None}, []))
+        self.assertEqual(self.ler("Nota", "7", "8", "9"), ({"1": 7.0, "2": 8.0, "3": 9.0}, []))
+        self.assertEqual(self.ler("7", "8"), ({}, ["A coluna tem 2 notas, mas a turma tem 3 alunos."]))
+
+    def test_uma_coluna_com_virgula_decimal(self):
+        # 7, 8 e 6 não são alunos da turma: são notas com vírgula decimal
+        self.assertEqual(self.ler("7,5", "8,0", "6,5"), ({"1": 7.5, "2": 8.0, "3": 6.5}, []))
+
+    def test_csv_com_virgula(self):
+        self.assertEqual(self.ler("3,7", "1,5"), ({"3": 7.0, "1": 5.0}, []))
+        self.assertEqual(self.ler("A2024001,7,5", "A2024003,8"), ({"1": 7.5, "3": 8.0}, []))
+        self.assertEqual(self.ler("id,nota", "1,7", "2,8", "3,9"), ({"1": 7.0, "2": 8.0, "3": 9.0}, []))
+
+    def test_csv_com_virgula_ambiguo(self):
+        # também seria uma coluna de notas 3,7 / 1,5 / 2,9 na ordem da turma
+        lote, erros = self.ler("3,7", "1,5", "2,9")
+        self.assertEqual(lote, {})
+        self.assertIn("';'", erros[0])
+
+if __name__ == "__main__":
+    unittest.main()
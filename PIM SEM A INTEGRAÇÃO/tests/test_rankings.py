@@ -0,0 +1,64 @@
+# Rankings mantidos nota a nota por definir_nota() contra a remontagem completa.
+# Rodar de dentro de "PIM SEM A INTEGRAÇÃO": python -m unittest discover tests
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from escola import armazenamento as A
+from escola import dominio as D
+
+def retrato(rk):
+    # {coleção: {chave: {aluno: valor}}} sem os rankings vazios
+    r = {nome: {c: dict(x._valor) for c, x in rk[nome].items() if len(x)}
+         for nome in ("atividade", "turma", "faltantes")}
+    r["escola"] = dict(rk["escola"]._valor)
+    r["medias"] = {a: m for a, m in rk["medias"].items() if m}
+    return r
+
+class RankingsIncrementais(unittest.TestCase):
+    def setUp(self):
+        A._periodo = None
+        A.alunos[:] = [{"id": i, "nome": f"Aluno {i}", "matricula": f"M{i}"} for i in range(1, 11)]
+        # alunos 4-6 nas duas turmas; 9 e 10 em nenhuma
+        A.turmas[:] = [{"id": 1, "nome": "T1", "alunos": [1, 2, 3, 4, 5, 6], "atividades": [1, 2, 3]},
+                       {"id": 2, "nome": "T2", "alunos": [4, 5, 6, 7, 8], "atividades": [4, 5]}]
+        A.atividades[:] = [{"id": i, "nome": f"P{i}", "turma_id": 1 if i <= 3 else 2, "notas": {}}
+                           for i in range(1, 6)]
+        A.invalidar_indices()
+        D.invalidar_rankings()
+
+    def assertMesmoRanking(self, incremental, remontado):
+        self.assertEqual(incremental.keys(), remontado.keys())
+        for nome in remontado:
+            self.assertEqual(incremental[nome].keys(), remontado[nome].keys(), nome)
+            for chave, valores in remontado[nome].items():
+                if isinstance(valores, dict):
+                    self.assertEqual(incremental[nome][chave].keys(), valores.keys(), (nome, chave))
+                    for aluno, v in valores.items():
+                        self.assertAlmostEqual(incremental[nome][chave][aluno], v, places=9, msg=(nome, chave, aluno))
+                else:
+                    # média na escola: a ordem da soma difere, só o arredondamento pode mudar
+                    self.assertAlmostEqual(incremental[nome][chave], valores, places=9, msg=(nome, chave))
+
+    def test_atualizacoes_aleatorias(self):
+        sorteio = random.Random(2024)
+        D.rankings()
+        for passo in range(2000):
+            atv = sorteio.choice(A.atividades)
+            aluno = sorteio.randint(1, 10)
+            nota = None if sorteio.random() < 0.3 else sorteio.choice([0, 5, 6.5, 7.25, 10.0, sorteio.uniform(0, 10)])
+            D.definir_nota(atv, aluno, nota)
+            if passo % 100 == 99:
+                incremental = D.rankings()
+                for nome in ("atividade", "turma", "faltantes"):
+                    for r in incremental[nome].values():
+                        self.assertEqual(r._ordem, sorted((v, c) for c, v in r._valor.items()))
+                incremental = retrato(incremental)
+                D.invalidar_rankings()
+                self.assertMesmoRanking(incremental, retrato(D.rankings()))
+
+if __name__ == "__main__":
+    unittest.main()